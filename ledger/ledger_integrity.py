@@ -18,8 +18,11 @@ This is read-only: it does not modify events, only reports.
 
 import json
 import math
+import os
 import sys
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
@@ -29,15 +32,30 @@ EVENT_ROOT = ROOT / "ledger" / "events"
 REPORT_DIR = ROOT / "scripts" / "reports" / "ledger"
 
 
-def iter_event_files() -> List[Path]:
-    if not EVENT_ROOT.exists():
-        return []
-    return sorted(EVENT_ROOT.rglob("*.json"))
+def iter_event_files() -> List[str]:
+    # Raw scandir walk: avoids building a Path object for every entry.
+    out: List[str] = []
+    stack = [str(EVENT_ROOT)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    out.append(entry.path)
+    # Split on separators so ordering matches the previous sorted(Path) output.
+    out.sort(key=lambda p: p.split(os.sep))
+    return out
 
 
-def load_json(path: Path) -> Tuple[Any, str]:
+def load_json(path: str) -> Tuple[Any, str]:
     try:
-        text = path.read_text(encoding="utf-8")
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
         data = json.loads(text)
         return data, ""
     except Exception as e:
@@ -56,21 +74,27 @@ def ensure_list(obj: Any) -> List[Dict[str, Any]]:
 
 
 def is_number(x: Any) -> bool:
-    try:
-        v = float(x)
-        return not math.isnan(v) and not math.isinf(v)
-    except Exception:
-        return False
-
-
-def parse_ts(ts: Any) -> Tuple[datetime, str]:
-    if not isinstance(ts, str):
-        return None, "ts not a string"
+    # JSON amounts are almost always int/float; only strings need the
+    # exception-guarded float() conversion.
+    if isinstance(x, float):
+        return math.isfinite(x)
+    if isinstance(x, int):
+        return -sys.float_info.max <= x <= sys.float_info.max
+    if isinstance(x, str):
+        try:
+            return math.isfinite(float(x))
+        except ValueError:
+            return False
+    return False
+
+
+@lru_cache(maxsize=8192)
+def _parse_ts_cached(ts: str) -> Tuple[datetime, str]:
+    # Ledgers often repeat timestamps across events; datetimes are immutable,
+    # so the parsed (dt, err) pair is safe to share between callers.
     try:
         # Accept ISO8601 with or without trailing Z
-        if ts.endswith("Z"):
-            ts = ts[:-1]
-        dt = datetime.fromisoformat(ts)
+        dt = datetime.fromisoformat(ts.removesuffix("Z"))
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt, ""
@@ -78,6 +102,36 @@ def parse_ts(ts: Any) -> Tuple[datetime, str]:
         return None, f"bad ts: {e}"
 
 
+def parse_ts(ts: Any) -> Tuple[datetime, str]:
+    if not isinstance(ts, str):
+        return None, "ts not a string"
+    return _parse_ts_cached(ts)
+
+
+# Errors are collected as (path, kind, payload) and only rendered to text
+# when the report is written, keeping string formatting off the scan loop.
+ErrorRecord = Tuple[str, str, Tuple[Any, ...]]
+
+
+def format_error(err: ErrorRecord) -> str:
+    path, kind, payload = err
+    if kind == "json":
+        detail = payload[0]
+    elif kind == "bad_id":
+        detail = f"missing/invalid id for event: {payload[0]!r}"
+    elif kind == "duplicate_id":
+        detail = f"duplicate id `{payload[0]}`"
+    elif kind == "bad_amount":
+        detail = f"non-numeric amount for id `{payload[0]}`: {payload[1]!r}"
+    elif kind == "bad_ts":
+        detail = f"{payload[1]} for id `{payload[0]}`"
+    elif kind == "future":
+        detail = f"future-dated event `{payload[0]}` at {payload[1].isoformat()}"
+    else:
+        detail = f"{kind}: {payload!r}"
+    return f"- `{path}` → {detail}"
+
+
 def analyze_events() -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
     files = iter_event_files()
@@ -92,17 +146,30 @@ def analyze_events() -> Dict[str, Any]:
         "negative_amounts": 0,
     }
 
-    errors: List[str] = []
+    errors: List[ErrorRecord] = []
     balances: Dict[str, float] = {}                # currency -> amount
     balances_by_stream: Dict[str, Dict[str, float]] = {}  # stream -> currency -> amount
-    seen_ids: set[str] = set()
+    # (id, path) for every event with a usable id; duplicates are found after
+    # the scan in a single Counter pass instead of a per-event membership test.
+    id_refs: List[Tuple[str, str]] = []
+
+    # Hot loop: keep counters and bound methods in locals, write back once.
+    errors_append = errors.append
+    id_refs_append = id_refs.append
+    files_scanned = 0
+    events_scanned = 0
+    files_with_errors = 0
+    events_with_errors = 0
+    duplicate_ids = 0
+    future_events = 0
+    negative_amounts = 0
 
     for path in files:
-        summary["files_scanned"] += 1
+        files_scanned += 1
         data, jerr = load_json(path)
         if jerr:
-            summary["files_with_errors"] += 1
-            errors.append(f"- `{path}` → {jerr}")
+            files_with_errors += 1
+            errors_append((path, "json", (jerr,)))
             continue
 
         events = ensure_list(data)
@@ -110,56 +177,73 @@ def analyze_events() -> Dict[str, Any]:
             continue
 
         for ev in events:
-            summary["events_scanned"] += 1
+            events_scanned += 1
 
             # Basic shape
-            eid = ev.get("id")
-            ts = ev.get("ts")
-            amt = ev.get("amount")
-            cur = ev.get("currency", "USD")
-            stream = ev.get("stream", "unknown")
-            kind = ev.get("kind", "unknown")
+            get = ev.get
+            eid = get("id")
+            ts = get("ts")
+            amt = get("amount")
+            cur = get("currency", "USD")
+            stream = get("stream", "unknown")
 
             # ID checks
             if not isinstance(eid, str) or not eid:
-                summary["events_with_errors"] += 1
-                errors.append(f"- `{path}` → missing/invalid id for event: {ev!r}")
-            elif eid in seen_ids:
-                summary["events_with_errors"] += 1
-                summary["duplicate_ids"] += 1
-                errors.append(f"- `{path}` → duplicate id `{eid}`")
+                events_with_errors += 1
+                errors_append((path, "bad_id", (ev,)))
             else:
-                seen_ids.add(eid)
+                id_refs_append((eid, path))
 
             # Amount checks
             if not is_number(amt):
-                summary["events_with_errors"] += 1
-                errors.append(f"- `{path}` → non-numeric amount for id `{eid}`: {amt!r}")
+                events_with_errors += 1
+                errors_append((path, "bad_amount", (eid, amt)))
                 continue  # can't use this event for balances
 
             amt_f = float(amt)
             if amt_f < 0:
-                summary["negative_amounts"] += 1
+                negative_amounts += 1
 
             # Timestamp checks
             ts_dt, ts_err = parse_ts(ts)
             if ts_err:
-                summary["events_with_errors"] += 1
-                errors.append(f"- `{path}` → {ts_err} for id `{eid}`")
-            else:
-                if ts_dt > now:
-                    summary["future_events"] += 1
-                    errors.append(
-                        f"- `{path}` → future-dated event `{eid}` at {ts_dt.isoformat()}"
-                    )
+                events_with_errors += 1
+                errors_append((path, "bad_ts", (eid, ts_err)))
+            elif ts_dt > now:
+                future_events += 1
+                errors_append((path, "future", (eid, ts_dt)))
 
             # Accumulate balances
             balances[cur] = balances.get(cur, 0.0) + amt_f
-            if stream not in balances_by_stream:
-                balances_by_stream[stream] = {}
-            balances_by_stream[stream][cur] = (
-                balances_by_stream[stream].get(cur, 0.0) + amt_f
-            )
+            by_cur = balances_by_stream.get(stream)
+            if by_cur is None:
+                by_cur = balances_by_stream[stream] = {}
+            by_cur[cur] = by_cur.get(cur, 0.0) + amt_f
+
+    id_counts = Counter(eid for eid, _ in id_refs)
+    dupes = {eid for eid, n in id_counts.items() if n > 1}
+    if dupes:
+        reported: set[str] = set()
+        for eid, path in id_refs:
+            if eid not in dupes:
+                continue
+            if eid in reported:
+                duplicate_ids += 1
+                errors_append((path, "duplicate_id", (eid,)))
+            else:
+                # First occurrence is the original; later ones are duplicates.
+                reported.add(eid)
+        events_with_errors += duplicate_ids
+
+    summary.update(
+        files_scanned=files_scanned,
+        events_scanned=events_scanned,
+        files_with_errors=files_with_errors,
+        events_with_errors=events_with_errors,
+        duplicate_ids=duplicate_ids,
+        future_events=future_events,
+        negative_amounts=negative_amounts,
+    )
 
     return {
         "summary": summary,
@@ -176,49 +260,46 @@ def write_report(result: Dict[str, Any]) -> Path:
     out = REPORT_DIR / f"ledger_integrity_{today}.md"
 
     s = result["summary"]
-    lines: List[str] = []
-
-    lines.append("# StegVerse Ledger Integrity Report")
-    lines.append("")
-    lines.append(f"- Generated at: `{result['generated_at']}`")
-    lines.append(f"- Event root: `ledger/events/`")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append(f"- Files scanned: **{s['files_scanned']}**")
-    lines.append(f"- Events scanned: **{s['events_scanned']}**")
-    lines.append(f"- Files with errors: **{s['files_with_errors']}**")
-    lines.append(f"- Events with errors: **{s['events_with_errors']}**")
-    lines.append(f"- Duplicate IDs: **{s['duplicate_ids']}**")
-    lines.append(f"- Future-dated events: **{s['future_events']}**")
-    lines.append(f"- Negative amounts: **{s['negative_amounts']}**")
-    lines.append("")
-
-    lines.append("## Balances by Currency")
-    if result["balances"]:
-        for cur, amt in sorted(result["balances"].items()):
-            lines.append(f"- **{cur}**: `{amt:.2f}`")
-    else:
-        lines.append("- No valid events yet.")
-    lines.append("")
-
-    lines.append("## Balances by Stream")
-    if result["balances_by_stream"]:
-        for stream, sub in sorted(result["balances_by_stream"].items()):
-            lines.append(f"- **{stream}**")
-            for cur, amt in sorted(sub.items()):
-                lines.append(f"  - {cur}: `{amt:.2f}`")
-    else:
-        lines.append("- No stream breakdown available.")
-    lines.append("")
-
-    lines.append("## Detected Issues")
-    if result["errors"]:
-        lines.extend(result["errors"])
-    else:
-        lines.append("- No integrity issues detected 🎉")
-    lines.append("")
+    with out.open("w", encoding="utf-8") as f:
+        w = f.write
+        w("# StegVerse Ledger Integrity Report\n\n")
+        w(f"- Generated at: `{result['generated_at']}`\n")
+        w("- Event root: `ledger/events/`\n\n")
+        w("## Summary\n")
+        w(f"- Files scanned: **{s['files_scanned']}**\n")
+        w(f"- Events scanned: **{s['events_scanned']}**\n")
+        w(f"- Files with errors: **{s['files_with_errors']}**\n")
+        w(f"- Events with errors: **{s['events_with_errors']}**\n")
+        w(f"- Duplicate IDs: **{s['duplicate_ids']}**\n")
+        w(f"- Future-dated events: **{s['future_events']}**\n")
+        w(f"- Negative amounts: **{s['negative_amounts']}**\n\n")
+
+        w("## Balances by Currency\n")
+        if result["balances"]:
+            for cur, amt in sorted(result["balances"].items()):
+                w(f"- **{cur}**: `{amt:.2f}`\n")
+        else:
+            w("- No valid events yet.\n")
+        w("\n")
+
+        w("## Balances by Stream\n")
+        if result["balances_by_stream"]:
+            for stream, sub in sorted(result["balances_by_stream"].items()):
+                w(f"- **{stream}**\n")
+                for cur, amt in sorted(sub.items()):
+                    w(f"  - {cur}: `{amt:.2f}`\n")
+        else:
+            w("- No stream breakdown available.\n")
+        w("\n")
+
+        w("## Detected Issues\n")
+        if result["errors"]:
+            for err in result["errors"]:
+                w(format_error(err))
+                w("\n")
+        else:
+            w("- No integrity issues detected 🎉\n")
 
-    out.write_text("\n".join(lines), encoding="utf-8")
     return out
 
 
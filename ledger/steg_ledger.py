@@ -18,6 +18,17 @@ from typing import List, Dict, Any
 import time
 import json
 
+try:
+    import orjson  # optional fast path for event emission
+except Exception:
+    orjson = None
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
 
 @dataclass
 class LedgerEvent:
@@ -41,7 +52,18 @@ class StegLedger:
             metadata=metadata,
         )
         self._events.append(ev)
-        print("[StegLedger]", json.dumps(ev.__dict__, default=str))
+        print(
+            "[StegLedger]",
+            _dumps(
+                {
+                    "ts": ev.ts,
+                    "event_type": event_type,
+                    "actor_id": actor_id,
+                    "amount_usd_equiv": amount_usd_equiv,
+                    "metadata": metadata,
+                }
+            ),
+        )
         return ev
 
     def all_events(self) -> List[LedgerEvent]:
@@ -21,6 +21,7 @@ Current assumptions (Genesis v0.1):
 
 from __future__ import annotations
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -40,26 +41,41 @@ class LedgerEvent:
     raw: Dict[str, Any]
 
 
-def _iter_event_files() -> Iterable[Path]:
+def _iter_event_entries() -> Iterable[os.DirEntry]:
     """
-    Yield all candidate event files under ledger/events.
-    Looks for both .json and .jsonl files.
+    Yield DirEntry objects for all candidate event files under ledger/events.
+    Looks for both .json and .jsonl files in a single scandir pass.
     """
-    if not EVENTS_ROOT.exists():
-        return
-    for ext in (".json", ".jsonl"):
-        for path in EVENTS_ROOT.rglob(f"*{ext}"):
-            if path.is_file():
-                yield path
+    stack = [str(EVENTS_ROOT)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith((".json", ".jsonl")) and entry.is_file():
+                    yield entry
+
+
+def _iter_event_files() -> Iterable[str]:
+    """
+    Yield all candidate event file paths under ledger/events.
+    """
+    for entry in _iter_event_entries():
+        yield entry.path
 
 
-def _load_json_any(path: Path) -> Any:
+def _load_json_any(path: str) -> Any:
     """
     Try to load JSON from a file that may be:
     - standard JSON (object or array)
     - JSON-lines (.jsonl): one JSON object per line
     """
-    text = path.read_text(encoding="utf-8", errors="ignore").strip()
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        text = f.read().strip()
     if not text:
         return []
 
@@ -106,6 +122,41 @@ def _normalize_event(raw: Dict[str, Any]) -> Optional[LedgerEvent]:
     """
     Convert a raw dict into a LedgerEvent, if possible.
     Returns None for unusable events.
+
+    Fast path for the canonical schema (string id/ts, numeric amount, string
+    or missing currency); anything else goes through _normalize_event_slow,
+    which owns the fallback rules. Both paths produce identical events.
+    """
+    try:
+        ev_id = raw["id"]
+        ts = raw["ts"]
+        amount = float(raw["amount"])
+    except (KeyError, TypeError, ValueError):
+        return _normalize_event_slow(raw)
+
+    currency = raw.get("currency")
+    if (
+        ev_id.__class__ is not str
+        or not ev_id
+        or ts.__class__ is not str
+        or not ts
+        or (currency is not None and currency.__class__ is not str)
+    ):
+        return _normalize_event_slow(raw)
+
+    return LedgerEvent(
+        id=ev_id,
+        ts=ts,
+        amount=amount,
+        currency=(currency.upper().strip() if currency else "") or "USD",
+        account=str(raw.get("account")) or str(raw.get("stream")) or "stegcore",
+        raw=raw,
+    )
+
+
+def _normalize_event_slow(raw: Dict[str, Any]) -> Optional[LedgerEvent]:
+    """
+    Generic normalization tolerating alternate keys and loose types.
     """
     try:
         ev_id = str(raw.get("id") or raw.get("event_id") or "")
@@ -136,13 +187,37 @@ def _normalize_event(raw: Dict[str, Any]) -> Optional[LedgerEvent]:
         return None
 
 
+# In-process cache of parsed events, keyed by the (path, mtime_ns, size) of
+# every event file so any edit, addition or removal forces a reload.
+_EVENTS_CACHE: Dict[frozenset, List[LedgerEvent]] = {}
+_EVENTS_CACHE_MAX = 4
+
+
 def load_all_events() -> List[LedgerEvent]:
     """
     Load and normalize all events from ledger/events/**.
     Skips files with unreadable JSON.
+
+    Results are memoized per process; repeated calls with unchanged event
+    files skip all JSON parsing.
     """
+    paths: List[str] = []
+    fingerprint = []
+    for entry in _iter_event_entries():
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        paths.append(entry.path)
+        fingerprint.append((entry.path, st.st_mtime_ns, st.st_size))
+    key = frozenset(fingerprint)
+
+    cached = _EVENTS_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
     events: List[LedgerEvent] = []
-    for path in _iter_event_files():
+    for path in paths:
         try:
             parsed = _load_json_any(path)
             raw_events = _normalize_raw_events(parsed)
@@ -153,7 +228,11 @@ def load_all_events() -> List[LedgerEvent]:
         except Exception:
             # Hygiene workers will flag parse issues separately
             continue
-    return events
+
+    if len(_EVENTS_CACHE) >= _EVENTS_CACHE_MAX:
+        _EVENTS_CACHE.pop(next(iter(_EVENTS_CACHE)))
+    _EVENTS_CACHE[key] = events
+    return list(events)
 
 
 def compute_balances(events: Iterable[LedgerEvent]) -> Dict[str, Dict[str, float]]:
@@ -173,8 +252,10 @@ def compute_balances(events: Iterable[LedgerEvent]) -> Dict[str, Dict[str, float
     for ev in events:
         cur = ev.currency
         acct = ev.account or "stegcore"
-        balances.setdefault(cur, {}).setdefault(acct, 0.0)
-        balances[cur][acct] += ev.amount
+        by_acct = balances.get(cur)
+        if by_acct is None:
+            by_acct = balances[cur] = {}
+        by_acct[acct] = by_acct.get(acct, 0.0) + ev.amount
     return balances
 
 
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBalance:
     owner_id: str
     amount: float = 0.0
@@ -26,12 +26,13 @@ class StegTokenLedger:
 
     def get_balance(self, owner_id: str) -> float:
         bal = self._balances.get(owner_id)
-        return bal.amount if bal else 0.0
+        return bal.amount if bal is not None else 0.0
 
     def _get_or_create(self, owner_id: str) -> TokenBalance:
-        if owner_id not in self._balances:
-            self._balances[owner_id] = TokenBalance(owner_id=owner_id, amount=0.0)
-        return self._balances[owner_id]
+        bal = self._balances.get(owner_id)
+        if bal is None:
+            bal = self._balances[owner_id] = TokenBalance(owner_id=owner_id, amount=0.0)
+        return bal
 
     def mint(self, owner_id: str, amount: float, reason: str = "") -> None:
         bal = self._get_or_create(owner_id)
@@ -15,14 +15,14 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletSnapshot:
     fiat_usd: float = 0.0
     crypto_usd_equiv: float = 0.0
     steg_tokens: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Wallet:
     owner_id: str
     balances: WalletSnapshot = field(default_factory=WalletSnapshot)
@@ -44,9 +44,25 @@ class WalletRegistry:
         self._wallets: Dict[str, Wallet] = {}
 
     def get_or_create(self, owner_id: str) -> Wallet:
-        if owner_id not in self._wallets:
-            self._wallets[owner_id] = Wallet(owner_id=owner_id)
-        return self._wallets[owner_id]
+        wallet = self._wallets.get(owner_id)
+        if wallet is None:
+            wallet = self._wallets[owner_id] = Wallet(owner_id=owner_id)
+        return wallet
+
+    def total_usd_equiv(self, steg_token_price_usd: float = 1.0) -> float:
+        """
+        Platform-wide total across all wallets.
+
+        Sums each balance column once and applies the token price a single
+        time, instead of calling Wallet.total_usd_equiv per wallet.
+        """
+        fiat = crypto = tokens = 0.0
+        for wallet in self._wallets.values():
+            b = wallet.balances
+            fiat += b.fiat_usd
+            crypto += b.crypto_usd_equiv
+            tokens += b.steg_tokens
+        return fiat + crypto + tokens * steg_token_price_usd
 
 
 REGISTRY = WalletRegistry()
@@ -11,55 +11,59 @@ Entry point for:
 
 from __future__ import annotations
 import datetime as _dt
+import io
 from pathlib import Path
 
 from ledger.steg_ledger_core import load_all_events, compute_balances, summarize_balances_md
 
 ROOT = Path(__file__).resolve().parents[1]
 TELEMETRY_DIR = ROOT / "ledger" / "telemetry" / "financial"
+DATE_FMT = "%Y-%m-%d"
 
 
 def generate_snapshot() -> Path:
     TELEMETRY_DIR.mkdir(parents=True, exist_ok=True)
 
-    today = _dt.datetime.utcnow().strftime("%Y-%m-%d")
-    ts = _dt.datetime.utcnow().isoformat() + "Z"
+    # One clock read for both the filename date and the header timestamp
+    now = _dt.datetime.now(_dt.timezone.utc)
+    today = now.strftime(DATE_FMT)
+    ts = now.isoformat().replace("+00:00", "Z")
     snapshot_path = TELEMETRY_DIR / f"wallet_snapshot_{today}.md"
 
     events = load_all_events()
     balances = compute_balances(events)
-    balance_lines = summarize_balances_md(balances)
 
-    lines = [
-        "# StegVerse Wallet Snapshot",
-        "",
-        f"- Generated at: `{ts}`",
-        "",
-        "## Balances by Account (USD)",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("# StegVerse Wallet Snapshot\n")
+    w("\n")
+    w(f"- Generated at: `{ts}`\n")
+    w("\n")
+    w("## Balances by Account (USD)\n")
+    w("\n")
 
     # If we have USD balances, show those under the primary heading
     usd_accounts = balances.get("USD", {})
     if usd_accounts:
         for acct, amt in sorted(usd_accounts.items()):
-            lines.append(f"- **{acct}**: {amt:,.2f} USD")
-        lines.append("")
-    else:
+            w(f"- **{acct}**: {amt:,.2f} USD\n")
+        w("\n")
+    elif not events:
         # Reuse the generic message if no USD yet
-        if not events:
-            lines.append("No ledger events recorded yet.")
-            lines.append("")
-        else:
-            lines.append("_No USD-denominated balances yet._")
-            lines.append("")
+        w("No ledger events recorded yet.\n")
+        w("\n")
+    else:
+        w("_No USD-denominated balances yet._\n")
+        w("\n")
 
     # Also include a full multi-currency section below
-    lines.append("## Full Balance Breakdown")
-    lines.append("")
-    lines.extend(summarize_balances_md(balances))
+    w("## Full Balance Breakdown\n")
+    w("\n")
+    for line in summarize_balances_md(balances):
+        w(line)
+        w("\n")
 
-    snapshot_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    snapshot_path.write_text(buf.getvalue(), encoding="utf-8")
     return snapshot_path
 
 
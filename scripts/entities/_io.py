@@ -0,0 +1,51 @@
+"""
+File-writing helpers shared by the entities package.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a sibling temp file, fsync it, then rename it over `path`,
+    so concurrent readers see either the old file or the new one, never a
+    partial write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def write_chunks(path: Path, chunks: List[bytes]) -> None:
+    """
+    Replace `path` with the concatenation of `chunks`, handing them to the
+    kernel as one gathered writev() per IOV_MAX chunks rather than one
+    write() per line.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for i in range(0, len(chunks), _IOV_MAX):
+            batch = chunks[i:i + _IOV_MAX]
+            if hasattr(os, "writev"):
+                written = os.writev(fd, batch)
+                if written == sum(map(len, batch)):
+                    continue
+                rest = memoryview(b"".join(batch))[written:]
+            else:
+                rest = memoryview(b"".join(batch))
+            while rest:
+                rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
@@ -0,0 +1,16 @@
+"""
+Filesystem anchors shared by the entities package.
+
+Resolved once per process; sibling modules import from here instead of each
+calling Path(__file__).resolve() on import.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]  # scripts/entities -> scripts -> ROOT
+
+REGISTRY_PATH = ROOT / "entities" / "registry.json"
+PERMISSIONS_DIR = ROOT / "entities" / "permissions"
+MANIFEST_PATH = ROOT / "scripts" / "entities" / "guardian_manifest.json"
+ENTITY_REPORTS_DIR = ROOT / "reports" / "entities"
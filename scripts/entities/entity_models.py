@@ -2,12 +2,22 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-ROOT = Path(__file__).resolve().parents[2]
-REGISTRY_PATH = ROOT / "entities" / "registry.json"
-PERMISSIONS_DIR = ROOT / "entities" / "permissions"
+from ._paths import ROOT, REGISTRY_PATH, PERMISSIONS_DIR
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
 
 
 @dataclass
@@ -19,14 +29,23 @@ class PermissionsProfile:
     @classmethod
     def load(cls, profile_id: str) -> "PermissionsProfile":
         path = PERMISSIONS_DIR / f"{profile_id}.json"
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
             return cls(id=profile_id, allowed_actions=[], forbidden_actions=[])
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls(
-            id=data.get("id", profile_id),
-            allowed_actions=data.get("allowed_actions", []),
-            forbidden_actions=data.get("forbidden_actions", []),
-        )
+        # Entities commonly share a profile (e.g. default_worker); parse it once.
+        return _load_permissions(profile_id, mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _load_permissions(profile_id: str, mtime_ns: int) -> PermissionsProfile:
+    path = PERMISSIONS_DIR / f"{profile_id}.json"
+    data = _read_json(path)
+    return PermissionsProfile(
+        id=data.get("id", profile_id),
+        allowed_actions=data.get("allowed_actions", []),
+        forbidden_actions=data.get("forbidden_actions", []),
+    )
 
 
 @dataclass
@@ -50,10 +69,21 @@ class Entity:
         return ROOT / self.memory_file
 
 
+# Parsed registry keyed by (path, mtime_ns); cleared whenever the file changes.
+_REGISTRY_CACHE: Dict[Tuple[Path, int], Dict[str, Entity]] = {}
+
+
 def load_registry() -> Dict[str, Entity]:
-    if not REGISTRY_PATH.exists():
+    try:
+        st = REGISTRY_PATH.stat()
+    except FileNotFoundError:
         raise RuntimeError(f"Entity registry not found at {REGISTRY_PATH}")
-    raw = json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
+    key = (REGISTRY_PATH, st.st_mtime_ns)
+    cached = _REGISTRY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    raw = _read_json(REGISTRY_PATH)
     ent_dict: Dict[str, Entity] = {}
     for e in raw.get("entities", []):
         entity = Entity(
@@ -67,6 +97,9 @@ def load_registry() -> Dict[str, Entity]:
             permissions_profile=e.get("permissions_profile", "default_worker"),
         )
         ent_dict[entity.id] = entity
+
+    _REGISTRY_CACHE.clear()
+    _REGISTRY_CACHE[key] = ent_dict
     return ent_dict
 
 
@@ -14,17 +14,34 @@ Designed to be called from a GitHub Actions job using PAT_WORKFLOW/GH_STEGVERSE_
 import json
 import os
 import subprocess
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
 
-ROOT = Path(__file__).resolve().parents[2]  # scripts/entities -> scripts -> ROOT
-MANIFEST_PATH = ROOT / "scripts" / "entities" / "guardian_manifest.json"
+from scripts.entities._paths import ROOT, MANIFEST_PATH
+from scripts.entities._io import write_atomic, write_chunks
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
+# task_id -> (module under scripts.entities.tasks, entry function)
+TASKS: Dict[str, Tuple[str, str]] = {
+    "workflow_health": ("workflow_health", "run"),
+    "readme_refresh": ("readme_refresh", "run"),
+}
+
+TS_FMT = "%Y-%m-%dT%H:%M:%SZ"
+
+_TASK_FN_CACHE: Dict[Tuple[str, str], Callable[..., Dict[str, Any]]] = {}
 
 
 def load_manifest() -> Dict[str, Any]:
     if not MANIFEST_PATH.exists():
         raise SystemExit(f"Guardian manifest not found at {MANIFEST_PATH}")
+    if orjson is not None:
+        return orjson.loads(MANIFEST_PATH.read_bytes())
     with MANIFEST_PATH.open("r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -36,11 +53,11 @@ def _call_task(module_name: str, func_name: str, manifest: Dict[str, Any]) -> Di
     module_name: e.g. 'workflow_health'
     func_name:   e.g. 'run'
     """
-    from importlib import import_module
-
-    mod_path = f"scripts.entities.tasks.{module_name}"
-    mod = import_module(mod_path)
-    fn = getattr(mod, func_name)
+    key = (module_name, func_name)
+    fn = _TASK_FN_CACHE.get(key)
+    if fn is None:
+        mod = import_module(f"scripts.entities.tasks.{module_name}")
+        fn = _TASK_FN_CACHE[key] = getattr(mod, func_name)
 
     return fn(manifest=manifest)
 
@@ -51,17 +68,14 @@ def main() -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     priorities = manifest.get("task_priorities", {})
-    # Known tasks in this runner
-    known_tasks = ["workflow_health", "readme_refresh"]
-
-    # Sort tasks by priority (default big number if not present)
+    # Sort known tasks by priority (default big number if not present)
     ordered_tasks = sorted(
-        known_tasks,
+        TASKS,
         key=lambda t: priorities.get(t, 999),
     )
 
     run_id = os.getenv("GITHUB_RUN_ID", "local")
-    ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    ts = datetime.now(timezone.utc).strftime(TS_FMT)
 
     overall: Dict[str, Any] = {
         "run_id": run_id,
@@ -76,10 +90,9 @@ def main() -> None:
     for task_id in ordered_tasks:
         print(f"\n--- Running guardian task: {task_id} ---")
         try:
-            if task_id == "workflow_health":
-                result = _call_task("workflow_health", "run", manifest)
-            elif task_id == "readme_refresh":
-                result = _call_task("readme_refresh", "run", manifest)
+            target = TASKS.get(task_id)
+            if target is not None:
+                result = _call_task(*target, manifest)
             else:
                 result = {
                     "task": task_id,
@@ -95,28 +108,31 @@ def main() -> None:
 
         overall["tasks"].append(result)
 
-    # Write JSON + Markdown summaries
+    # Write the JSON summary atomically, the Markdown one as a gathered write
     json_path = reports_dir / "guardian_run_latest.json"
-    json_path.write_text(json.dumps(overall, indent=2), encoding="utf-8")
+    if orjson is not None:
+        json_bytes = orjson.dumps(overall, option=orjson.OPT_INDENT_2)
+    else:
+        json_bytes = json.dumps(overall, indent=2).encode("utf-8")
+    write_atomic(json_path, json_bytes)
 
     md_path = reports_dir / f"guardian_run_{run_id}.md"
-    lines: List[str] = [
-        "# StegVerse Guardian Run",
-        f"- Run ID: `{run_id}`",
-        f"- Time (UTC): `{ts}`",
-        "",
-        "## Tasks",
+    chunks: List[bytes] = [
+        b"# StegVerse Guardian Run\n",
+        f"- Run ID: `{run_id}`\n".encode("utf-8"),
+        f"- Time (UTC): `{ts}`\n".encode("utf-8"),
+        b"\n",
+        b"## Tasks\n",
     ]
     for t in overall["tasks"]:
         status = t.get("status", "unknown")
         name = t.get("task", "unknown")
-        lines.append(f"- **{name}** — `{status}`")
+        chunks.append(f"- **{name}** — `{status}`\n".encode("utf-8"))
         if "summary" in t:
-            lines.append(f"  - {t['summary']}")
+            chunks.append(f"  - {t['summary']}\n".encode("utf-8"))
         if "error" in t:
-            lines.append(f"  - Error: `{t['error']}`")
-
-    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            chunks.append(f"  - Error: `{t['error']}`\n".encode("utf-8"))
+    write_chunks(md_path, chunks)
     print(f"\nGuardian report written to: {md_path}")
 
 
@@ -1,21 +1,64 @@
 from __future__ import annotations
 
+import atexit
 import datetime as dt
+import io
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .entity_models import Entity
 
 
+class MemoryWriter:
+    """
+    Process-wide buffer for memory appends.
+
+    Entries are accumulated per memory file and written with a single
+    open/write per file, either once a buffer passes FLUSH_THRESHOLD bytes
+    or when the interpreter exits.
+    """
+
+    FLUSH_THRESHOLD = 64 * 1024
+
+    def __init__(self) -> None:
+        self._buffers: Dict[Path, io.BytesIO] = {}
+
+    def append(self, path: Path, data: bytes) -> None:
+        buf = self._buffers.get(path)
+        if buf is None:
+            buf = self._buffers[path] = io.BytesIO()
+        buf.write(data)
+        if buf.tell() >= self.FLUSH_THRESHOLD:
+            self.flush(path)
+
+    def flush(self, path: Path) -> None:
+        buf = self._buffers.pop(path, None)
+        if buf is None or not buf.tell():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as f:
+            f.write(buf.getbuffer())
+
+    def flush_all(self) -> None:
+        for path in list(self._buffers):
+            self.flush(path)
+
+
+_WRITER = MemoryWriter()
+atexit.register(_WRITER.flush_all)
+
+
 def append_memory(entity: Entity, heading: str, body: str, *, kind: str = "note") -> None:
     """
     Append a markdown entry to an entity's memory file.
     kind: 'note' | 'run' | 'error' etc.
+
+    Writes are buffered; call flush_memory() if the file must be on disk
+    before the process exits.
     """
     path: Path = entity.memory_path
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    ts = dt.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    ts = dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
     lines = [
         f"## [{kind.upper()}] {heading}",
@@ -27,5 +70,14 @@ def append_memory(entity: Entity, heading: str, body: str, *, kind: str = "note"
         "---",
         "",
     ]
-    with path.open("a", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    _WRITER.append(path, "\n".join(lines).encode("utf-8"))
+
+
+def flush_memory(entity: Optional[Entity] = None) -> None:
+    """
+    Flush buffered memory entries for one entity, or for all entities.
+    """
+    if entity is None:
+        _WRITER.flush_all()
+    else:
+        _WRITER.flush(entity.memory_path)
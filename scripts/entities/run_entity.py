@@ -15,9 +15,11 @@ from entities.entity_models import get_entity  # type: ignore
 from entities.task_graph import default_task_graph  # type: ignore
 from entities.task_router import run_task  # type: ignore
 from entities.memory_store import append_memory  # type: ignore
+from entities._io import write_chunks  # type: ignore
+from entities._paths import ENTITY_REPORTS_DIR as REPORTS_DIR  # type: ignore
 
-REPORTS_DIR = ROOT / "reports" / "entities"
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+RUN_ID_FMT = "%Y%m%d-%H%M%S"
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -37,7 +39,7 @@ def main(argv: List[str] | None = None) -> int:
     graph = default_task_graph()
     ordered = graph.linear_order(selected_tasks)
 
-    run_id = dt.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    run_id = dt.datetime.now(dt.timezone.utc).strftime(RUN_ID_FMT)
     heading = f"Run {run_id} for {entity.id}"
     log_lines = [f"Entity: {entity.id}", f"Tasks: {', '.join(ordered)}", ""]
 
@@ -63,22 +65,20 @@ def main(argv: List[str] | None = None) -> int:
 
     # Write a run report
     report_path = REPORTS_DIR / f"{entity.id}-run-{run_id}.md"
-    md = [
-        f"# Entity Run Report",
-        f"- entity: `{entity.id}`",
-        f"- name: `{entity.name}`",
-        f"- role: `{entity.role}`",
-        f"- run_id: `{run_id}`",
-        "",
-        "## Tasks",
+    chunks: List[bytes] = [
+        b"# Entity Run Report\n",
+        f"- entity: `{entity.id}`\n".encode("utf-8"),
+        f"- name: `{entity.name}`\n".encode("utf-8"),
+        f"- role: `{entity.role}`\n".encode("utf-8"),
+        f"- run_id: `{run_id}`\n".encode("utf-8"),
+        b"\n",
+        b"## Tasks\n",
     ]
     for r in results:
-        md.append(f"- `{r['task']}` → rc={r.get('return_code', 0)}")
-    md.append("")
-    md.append("## Details")
-    md.extend(log_lines)
-
-    report_path.write_text("\n".join(md) + "\n", encoding="utf-8")
+        chunks.append(f"- `{r['task']}` → rc={r.get('return_code', 0)}\n".encode("utf-8"))
+    chunks.append(b"\n## Details\n")
+    chunks.extend((line + "\n").encode("utf-8") for line in log_lines)
+    write_chunks(report_path, chunks)
 
     # Append to entity memory
     append_memory(entity, heading=heading, body="\n".join(log_lines), kind="run")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterator, List, Set
 
 
 @dataclass
@@ -23,33 +23,35 @@ class TaskGraph:
         """
         Return tasks in a sane execution order. For now, we do a simple
         depth-first topological sort over the selected tasks.
+
+        Iterative post-order DFS: `visited` doubles as the dedup set, so each
+        task is appended exactly once and deep graphs can't hit the
+        recursion limit.
         """
         result: List[str] = []
-        visited: Dict[str, bool] = {}
-
-        def visit(tid: str):
-            if tid in visited:
-                return
-            visited[tid] = True
-            node = self.nodes.get(tid)
-            if not node:
-                result.append(tid)
-                return
-            for dep in node.after:
-                visit(dep)
-            result.append(tid)
+        visited: Set[str] = set()
+        nodes = self.nodes
 
-        for tid in selected:
-            visit(tid)
+        def deps_of(tid: str) -> Iterator[str]:
+            node = nodes.get(tid)
+            return iter(node.after) if node else iter(())
 
-        # Keep order stable while removing duplicates
-        seen = set()
-        ordered: List[str] = []
-        for t in result:
-            if t not in seen:
-                seen.add(t)
-                ordered.append(t)
-        return ordered
+        for root in selected:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, deps_of(root))]
+            while stack:
+                tid, deps = stack[-1]
+                for dep in deps:
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, deps_of(dep)))
+                        break
+                else:
+                    stack.pop()
+                    result.append(tid)
+        return result
 
 
 def default_task_graph() -> TaskGraph:
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import http.client
+import io
 import json
 import os
+import runpy
 import subprocess
+import sys
+import traceback
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 
-ROOT = Path(__file__).resolve().parents[2]
+from ._io import write_atomic
+from ._paths import ROOT, ENTITY_REPORTS_DIR
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
+# Set STEGVERSE_SUBPROC=1 to run task scripts in a child interpreter (isolation)
+# instead of in-process.
+USE_SUBPROCESS = os.getenv("STEGVERSE_SUBPROC") == "1"
 
 # Where we'll write entity run reports
-ENTITY_REPORTS_DIR = ROOT / "reports" / "entities"
 ENTITY_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
@@ -26,11 +42,44 @@ def _run_cmd(cmd: str) -> Tuple[int, str]:
     return proc.returncode, out
 
 
+def _run_in_process(fn: Callable[[], Any]) -> Tuple[int, str]:
+    """
+    Run a Python entry point in this interpreter, capturing stdout+stderr the
+    same way _run_cmd does, and mapping SystemExit/exceptions to a return code.
+    """
+    buf = io.StringIO()
+    rc = 0
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            fn()
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                rc = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                rc = 1
+        except Exception:
+            traceback.print_exc()
+            rc = 1
+    return rc, buf.getvalue()
+
+
+def _wallet_view_main() -> None:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from ledger import steg_wallet_view
+
+    steg_wallet_view.main()
+
+
 def run_economic_snapshot() -> Dict[str, Any]:
     """
     Calls your existing Economic Snapshot workflow logic (Python module).
     """
-    rc, out = _run_cmd("python -m ledger.steg_wallet_view")
+    if USE_SUBPROCESS:
+        rc, out = _run_cmd("python -m ledger.steg_wallet_view")
+    else:
+        rc, out = _run_in_process(_wallet_view_main)
     return {
         "task": "economic_snapshot",
         "return_code": rc,
@@ -49,7 +98,10 @@ def run_repo_hygiene() -> Dict[str, Any]:
             "return_code": 0,
             "output": "repo_audit.py not found; skipping hygiene.",
         }
-    rc, out = _run_cmd("python scripts/repo_audit.py")
+    if USE_SUBPROCESS:
+        rc, out = _run_cmd("python scripts/repo_audit.py")
+    else:
+        rc, out = _run_in_process(lambda: runpy.run_path(str(script), run_name="__main__"))
     return {
         "task": "repo_hygiene",
         "return_code": rc,
@@ -57,18 +109,42 @@ def run_repo_hygiene() -> Dict[str, Any]:
     }
 
 
-def _call_github_models(prompt: str, *, system: str = "") -> str:
+MODELS_HOST = "models.github.ai"
+MODELS_PATH = "/inference/chat/completions"
+
+# Kept alive across calls so repeated digests in one process skip the TCP+TLS
+# handshake; reset and re-dialed once if the server dropped it.
+_models_conn: Optional[http.client.HTTPSConnection] = None
+
+
+def _post_github_models(body: bytes, headers: Dict[str, str]) -> bytes:
+    global _models_conn
+    for attempt in range(2):
+        if _models_conn is None:
+            _models_conn = http.client.HTTPSConnection(MODELS_HOST, timeout=30)
+        try:
+            _models_conn.request("POST", MODELS_PATH, body=body, headers=headers)
+            resp = _models_conn.getresponse()
+            data = resp.read()
+        except (http.client.HTTPException, OSError):
+            _models_conn.close()
+            _models_conn = None
+            if attempt:
+                raise
+            continue
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason}: {data[:200]!r}")
+        return data
+    raise RuntimeError("unreachable")
+
+
+def _request_github_models(prompt: str, token: str, *, system: str = "") -> str:
     """
-    Very small wrapper to GitHub Models chat.completions.
-    Uses GH_TOKEN or GITHUB_TOKEN from the environment.
+    POST a chat.completions request to GitHub Models and return the reply
+    text. Raises on any transport, HTTP or response-shape error.
     """
-    import urllib.request
     import json as _json
 
-    token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
-    if not token:
-        return "No GH_TOKEN/GITHUB_TOKEN available; cannot call GitHub Models."
-
     payload = {
         "model": "openai/gpt-4.1-mini",
         "messages": [
@@ -78,24 +154,86 @@ def _call_github_models(prompt: str, *, system: str = "") -> str:
         "max_tokens": 900,
         "temperature": 0.2,
     }
-    data = _json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        "https://models.github.ai/inference/chat/completions",
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-GitHub-Api-Version": "2022-11-28",
-        },
-        method="POST",
-    )
+    data = orjson.dumps(payload) if orjson is not None else _json.dumps(payload).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    body = _post_github_models(data, headers)
+    parsed = orjson.loads(body) if orjson is not None else _json.loads(body.decode("utf-8"))
+    return parsed["choices"][0]["message"]["content"]
+
+
+def _call_github_models(prompt: str, *, system: str = "") -> Tuple[str, bool]:
+    """
+    Very small wrapper to GitHub Models chat.completions.
+    Uses GH_TOKEN or GITHUB_TOKEN from the environment.
+    Returns (text, ok); on failure the text explains what went wrong.
+    """
+    token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+    if not token:
+        return "No GH_TOKEN/GITHUB_TOKEN available; cannot call GitHub Models.", False
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            txt = resp.read().decode("utf-8")
-            parsed = _json.loads(txt)
-            return parsed["choices"][0]["message"]["content"]
+        return _request_github_models(prompt, token, system=system), True
     except Exception as e:
-        return f"GitHub Models call failed: {e!r}"
+        return f"GitHub Models call failed: {e!r}", False
+
+
+# Successful digests keyed by a hash of the prompt. Identical telemetry gives
+# an identical prompt, so repeat runs skip the model call entirely. File mtime
+# doubles as the LRU access time. The cache is best-effort: I/O errors
+# just mean a miss or an unsaved entry. Lives under the gitignored .cache/
+# dir so the entities workflow never commits cached model output.
+DIGEST_CACHE_DIR = ENTITY_REPORTS_DIR / ".cache" / "digests"
+DIGEST_CACHE_MAX = 256
+
+
+def _digest_cache_get(key: str) -> Optional[str]:
+    path = DIGEST_CACHE_DIR / f"{key}.md"
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return text
+
+
+def _digest_cache_put(key: str, text: str) -> None:
+    try:
+        DIGEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(DIGEST_CACHE_DIR / f"{key}.md", text.encode("utf-8"))
+
+        entries = [e for e in os.scandir(DIGEST_CACHE_DIR) if e.name.endswith(".md")]
+        if len(entries) > DIGEST_CACHE_MAX:
+            entries.sort(key=lambda e: e.stat().st_mtime_ns)
+            for e in entries[: len(entries) - DIGEST_CACHE_MAX]:
+                os.remove(e.path)
+    except OSError:
+        pass
+
+
+def _latest_report(directory: Path, prefix: str, suffix: str) -> Optional[Path]:
+    """
+    Return the lexicographically last `<prefix>*<suffix>` file in `directory`
+    (report names embed the date), using one scandir pass instead of sorting
+    every match.
+    """
+    best: Optional[str] = None
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                if best is None or name > best:
+                    best = name
+    except FileNotFoundError:
+        return None
+    return directory / best if best is not None else None
 
 
 def run_status_digest() -> Dict[str, Any]:
@@ -104,20 +242,19 @@ def run_status_digest() -> Dict[str, Any]:
     synthesizes a short status digest via GitHub Models.
     """
     pieces = []
+    cached = False
 
     # Financial telemetry
     fin_dir = ROOT / "ledger" / "telemetry" / "financial"
-    if fin_dir.exists():
-        latest = sorted(fin_dir.glob("wallet_snapshot_*.md"))[-1:]  # last one
-        for p in latest:
-            pieces.append(f"# Wallet Snapshot ({p.name})\n" + p.read_text(encoding="utf-8"))
+    latest = _latest_report(fin_dir, "wallet_snapshot_", ".md")
+    if latest is not None:
+        pieces.append(f"# Wallet Snapshot ({latest.name})\n" + latest.read_text(encoding="utf-8"))
 
     # Ledger integrity (if present)
     integ_dir = ROOT / "ledger" / "telemetry" / "integrity"
-    if integ_dir.exists():
-        latest = sorted(integ_dir.glob("ledger_integrity_*.md"))[-1:]
-        for p in latest:
-            pieces.append(f"# Ledger Integrity ({p.name})\n" + p.read_text(encoding="utf-8"))
+    latest = _latest_report(integ_dir, "ledger_integrity_", ".md")
+    if latest is not None:
+        pieces.append(f"# Ledger Integrity ({latest.name})\n" + latest.read_text(encoding="utf-8"))
 
     if not pieces:
         text = "No financial or integrity telemetry files found; nothing to summarize."
@@ -133,25 +270,37 @@ def run_status_digest() -> Dict[str, Any]:
             "2) Bullet list of risks\n"
             "3) Bullet list of suggested next actions for StegVerse AI entities."
         )
-        ai_summary = _call_github_models(prompt)
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        ai_summary = _digest_cache_get(key)
+        if ai_summary is not None:
+            cached = True
+        else:
+            ai_summary, ok = _call_github_models(prompt)
+            if ok:
+                _digest_cache_put(key, ai_summary)
 
     return {
         "task": "status_digest",
         "return_code": 0,
         "output": ai_summary,
+        "cached": cached,
     }
 
 
+_DISPATCH: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "economic_snapshot": run_economic_snapshot,
+    "repo_hygiene": run_repo_hygiene,
+    "status_digest": run_status_digest,
+}
+
+
 def run_task(task_id: str) -> Dict[str, Any]:
     """
     Main router entry point.
     """
-    if task_id == "economic_snapshot":
-        return run_economic_snapshot()
-    if task_id == "repo_hygiene":
-        return run_repo_hygiene()
-    if task_id == "status_digest":
-        return run_status_digest()
+    handler = _DISPATCH.get(task_id)
+    if handler is not None:
+        return handler()
     return {
         "task": task_id,
         "return_code": 0,
@@ -3,7 +3,7 @@ Guardian Task: readme_refresh
 
 Phase 1:
 - Scans configured repos/readme_targets from guardian_manifest
-- Fetches current README content via `gh api`
+- Fetches current README content via the GitHub REST API (in parallel)
 - Produces a "refresh plan" report (what should be clarified/added), but does NOT edit files yet.
 
 Later:
@@ -13,73 +13,145 @@ Later:
 
 import json
 import os
-import subprocess
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
-
-
-ROOT = Path(__file__).resolve().parents[3]
-
-
-def _run(cmd: str, env: Dict[str, str]) -> str:
-    proc = subprocess.run(
-        cmd,
-        shell=True,
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    return proc.stdout
-
-
-def _fetch_file(repo: str, path: str, env: Dict[str, str]) -> str:
-    # Use gh api to fetch a file's contents (raw)
-    cmd = f'gh api repos/{repo}/contents/{path} --jq ".content"'
-    out = _run(cmd, env).strip()
-    if not out or out.startswith("Not Found"):
-        return ""
-    # content is base64; decode via Python
-    import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+from .._io import write_atomic
+from .._paths import ROOT
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
+GITHUB_API = "https://api.github.com"
+MAX_FETCH_WORKERS = 16
+
+# Very simple heuristic: sections every README should mention, pre-lowered
+# so each README is lowercased once and scanned with plain substring checks.
+NEEDED_SECTIONS = ("Quick Start", "For Developers", "For AI Entities", "Troubleshooting")
+_NEEDED_SECTIONS_LC = tuple((s, s.lower()) for s in NEEDED_SECTIONS)
+
+
+def _fetch_file(
+    repo: str,
+    path: str,
+    token: Optional[str],
+    cached: Optional[Dict[str, str]] = None,
+) -> Tuple[str, Optional[str]]:
+    """
+    Return (content, etag) for a file, asking the contents API for the raw body
+    directly (no gh subprocess, no base64).
+
+    If `cached` holds an etag from a previous run the request is conditional;
+    a 304 reuses the cached content without transferring the body.
+    """
+    headers = {
+        "Accept": "application/vnd.github.raw",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    req = urllib.request.Request(f"{GITHUB_API}/repos/{repo}/contents/{path}", headers=headers)
     try:
-        return base64.b64decode(out).decode("utf-8", errors="ignore")
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read().decode("utf-8", errors="ignore"), resp.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached.get("content", ""), cached.get("etag")
+        return "", None
+    except (urllib.error.URLError, OSError):
+        return "", None
+
+
+def _load_cache(path: Path) -> Dict[str, Dict[str, str]]:
+    if not path.exists():
+        return {}
+    try:
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
-        return ""
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_cache(path: Path, cache: Dict[str, Dict[str, str]]) -> None:
+    if orjson is not None:
+        data = orjson.dumps(cache, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(cache, indent=2, sort_keys=True).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, data)
 
 
 def run(*, manifest: Dict[str, Any]) -> Dict[str, Any]:
     gh_token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
-    env = os.environ.copy()
-    if gh_token:
-        env["GH_TOKEN"] = gh_token
 
     readme_targets: Dict[str, List[str]] = manifest.get("readme_targets", {})
-    results: List[Dict[str, Any]] = []
+    targets: List[Tuple[str, str]] = [
+        (repo, path)
+        for repo, paths in sorted(readme_targets.items())
+        for path in paths
+    ]
 
-    for repo, paths in sorted(readme_targets.items()):
-        for path in paths:
-            content = _fetch_file(repo, path, env)
-            if not content:
-                results.append({
-                    "repo": repo,
-                    "path": path,
-                    "status": "missing_or_inaccessible",
-                })
-                continue
+    reports_dir = ROOT / manifest.get("reports_dir", "reports/guardians")
+    reports_dir.mkdir(parents=True, exist_ok=True)
 
-            # Very simple heuristic: check for key sections
-            needed_sections = ["Quick Start", "For Developers", "For AI Entities", "Troubleshooting"]
-            missing_sections = [s for s in needed_sections if s.lower() not in content.lower()]
+    # (repo/path) -> {"etag", "content"} from earlier runs; unchanged files come
+    # back as 304 and reuse the cached body. Kept under the gitignored .cache/
+    # dir so README bodies are never committed alongside the reports.
+    cache_path = reports_dir / ".cache" / "readme_cache.json"
+    cache = _load_cache(cache_path)
+
+    def fetch(target: Tuple[str, str]) -> Tuple[str, Optional[str]]:
+        repo, path = target
+        return _fetch_file(repo, path, gh_token, cache.get(f"{repo}/{path}"))
+
+    # Network-bound: fetch all targets concurrently, keep results in target order.
+    fetched: List[Tuple[str, Optional[str]]] = []
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(targets))) as pool:
+            fetched = list(pool.map(fetch, targets))
+
+    contents: List[str] = []
+    new_cache: Dict[str, Dict[str, str]] = {}
+    for (repo, path), (content, etag) in zip(targets, fetched):
+        contents.append(content)
+        if content and etag:
+            new_cache[f"{repo}/{path}"] = {"etag": etag, "content": content}
+    if new_cache != cache:
+        _save_cache(cache_path, new_cache)
 
-            status = "ok" if not missing_sections else "needs_improvement"
+    results: List[Dict[str, Any]] = []
 
+    for (repo, path), content in zip(targets, contents):
+        if not content:
             results.append({
                 "repo": repo,
                 "path": path,
-                "status": status,
-                "missing_sections": missing_sections,
+                "status": "missing_or_inaccessible",
             })
+            continue
+
+        content_lc = content.lower()
+        missing_sections = [s for s, s_lc in _NEEDED_SECTIONS_LC if s_lc not in content_lc]
+
+        status = "ok" if not missing_sections else "needs_improvement"
+
+        results.append({
+            "repo": repo,
+            "path": path,
+            "status": status,
+            "missing_sections": missing_sections,
+        })
 
     # Summarize
     total = len(results)
@@ -91,11 +163,12 @@ def run(*, manifest: Dict[str, Any]) -> Dict[str, Any]:
         f"{needs} need improvements, {missing} missing/inaccessible."
     )
 
-    reports_dir = ROOT / manifest.get("reports_dir", "reports/guardians")
-    reports_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     report_path = reports_dir / f"readme_refresh_{ts.replace(':','-')}.json"
-    report_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if orjson is not None:
+        report_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        report_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
 
     print("=== readme_refresh ===")
     print(summary)
@@ -3,95 +3,334 @@ Guardian Task: workflow_health
 
 Checks the recent health of critical workflows across StegVerse repos.
 
-- Uses `gh` CLI (expects GH_TOKEN/GITHUB_TOKEN already configured in the workflow)
+- Queries the GitHub Actions REST API directly, in parallel (GH_TOKEN/GITHUB_TOKEN from env)
+- Reports each workflow's latest run on the repo's default branch, on both
+  the GraphQL batch and the REST fallback
 - Reads `critical_workflows` from guardian_manifest.json
 - Writes a per-task summary dict back to guardian_runner
 """
 
 import json
 import os
-import subprocess
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from .._io import write_atomic
+from .._paths import ROOT
 
-ROOT = Path(__file__).resolve().parents[3]  # tasks -> entities -> scripts -> ROOT
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
 
+GITHUB_API = "https://api.github.com"
+MAX_FETCH_WORKERS = 10
 
-def _run(cmd: str, env: Dict[str, str]) -> str:
-    proc = subprocess.run(
-        cmd,
-        shell=True,
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+# Guardian ticks come minutes apart; run state rarely changes faster than this.
+WF_CACHE_TTL = 300  # seconds
+WF_CACHE_NAME = ".cache/wf_etag_cache.json"  # under reports_dir; gitignored
+
+
+def _api_get(
+    path: str, token: Optional[str], etag: Optional[str] = None
+) -> Tuple[Any, Optional[str]]:
+    """
+    GET a GitHub REST endpoint and return (decoded JSON body, etag).
+
+    With `etag` the request is conditional; a 304 returns (None, etag) and
+    does not count against the rate limit. Raises on other HTTP errors.
+    """
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    if etag:
+        headers["If-None-Match"] = etag
+    req = urllib.request.Request(f"{GITHUB_API}{path}", headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return json.loads(resp.read().decode("utf-8")), resp.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and etag:
+            return None, etag
+        raise
+
+
+def _workflow_ids(repo: str, token: Optional[str]) -> Dict[str, int]:
+    """
+    Map each workflow's display name and file name to its numeric id.
+    The manifest lists workflows by name, but the runs endpoint wants an id.
+    """
+    data, _ = _api_get(f"/repos/{repo}/actions/workflows?per_page=100", token)
+    ids: Dict[str, int] = {}
+    for wf in data.get("workflows", []):
+        ids[wf["name"]] = wf["id"]
+        ids[os.path.basename(wf.get("path", ""))] = wf["id"]
+    return ids
+
+
+def _resolve_ids(
+    repo: str, token: Optional[str]
+) -> Tuple[Optional[Dict[str, int]], Optional[str], str]:
+    """Return (workflow ids, default branch, error) for one repo."""
+    try:
+        info, _ = _api_get(f"/repos/{repo}", token)
+        return _workflow_ids(repo, token), info.get("default_branch"), ""
+    except Exception as e:
+        return None, None, str(e)
+
+
+def _health(repo: str, wf_name: str, run_: Dict[str, Any]) -> Dict[str, Any]:
+    status = run_.get("status")
+    conclusion = run_.get("conclusion")
+    updated_at = run_.get("updated_at")
+
+    if conclusion == "success":
+        health = "healthy"
+    elif conclusion in ("failure", "cancelled", "timed_out", "stale"):
+        health = "failing"
+    else:
+        health = f"status:{status}, conclusion:{conclusion}"
+
+    return {
+        "repo": repo,
+        "workflow": wf_name,
+        "status": health,
+        "last_status": status,
+        "last_conclusion": conclusion,
+        "last_updated": updated_at,
+    }
+
+
+_SUITES_FIELDS = (
+    "checkSuites(first: 50) { nodes { status conclusion "
+    "workflowRun { updatedAt workflow { name } } } }"
+)
+
+
+def _graphql_latest_runs(
+    repos: List[str], token: str
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Fetch, in one GraphQL request, the latest run of every workflow that ran
+    on each repo's default-branch HEAD.
+
+    Returns repo -> workflow name -> {status, conclusion, updated_at}, with
+    enum values lowercased to match the REST API.
+    """
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, _, name = repo.partition("/")
+        fields.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ defaultBranchRef {{ target {{ ... on Commit {{ {_SUITES_FIELDS} }} }} }} }}"
+        )
+    query = "query { " + " ".join(fields) + " }"
+
+    req = urllib.request.Request(
+        f"{GITHUB_API}/graphql",
+        data=json.dumps({"query": query}).encode("utf-8"),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        data = (json.loads(resp.read().decode("utf-8")).get("data")) or {}
+
+    latest: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for i, repo in enumerate(repos):
+        runs: Dict[str, Dict[str, Any]] = {}
+        node = data.get(f"r{i}") or {}
+        target = (node.get("defaultBranchRef") or {}).get("target") or {}
+        for suite in (target.get("checkSuites") or {}).get("nodes") or []:
+            wf_run = (suite or {}).get("workflowRun")
+            if not wf_run:
+                continue
+            name = (wf_run.get("workflow") or {}).get("name")
+            updated_at = wf_run.get("updatedAt")
+            prev = runs.get(name)
+            if prev is not None and (prev["updated_at"] or "") >= (updated_at or ""):
+                continue
+            runs[name] = {
+                "status": (suite.get("status") or "").lower() or None,
+                "conclusion": (suite.get("conclusion") or "").lower() or None,
+                "updated_at": updated_at,
+            }
+        latest[repo] = runs
+    return latest
+
+
+def _check(
+    repo: str,
+    wf_name: str,
+    ids: Optional[Dict[str, int]],
+    branch: Optional[str],
+    err: str,
+    token: Optional[str],
+    cached: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Return (result, etag) for one workflow via REST, from its latest run on
+    `branch` (the default branch, as the GraphQL batch sees it). If `cached`
+    carries an etag the request is conditional, and a 304 reuses the cached
+    result.
+    """
+    wf_id = ids.get(wf_name) if ids is not None else None
+    if wf_id is None:
+        return {
+            "repo": repo,
+            "workflow": wf_name,
+            "status": "error",
+            "raw_output": err or f"workflow {wf_name!r} not found in {repo}",
+        }, None
+    etag = cached.get("etag") if cached else None
+    query = "per_page=1"
+    if branch:
+        query += f"&branch={urllib.parse.quote(branch, safe='')}"
+    try:
+        data, etag = _api_get(
+            f"/repos/{repo}/actions/workflows/{wf_id}/runs?{query}", token, etag
+        )
+    except Exception as e:
+        return {
+            "repo": repo,
+            "workflow": wf_name,
+            "status": "error",
+            "raw_output": str(e),
+        }, None
+    if data is None and cached:
+        return cached["result"], etag
+
+    runs = data.get("workflow_runs") or []
+    if not runs:
+        return {
+            "repo": repo,
+            "workflow": wf_name,
+            "status": "no_runs",
+        }, etag
+    return _health(repo, wf_name, runs[0]), etag
+
+
+def _valid_entry(entry: Any) -> bool:
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("fetched_at"), (int, float))
+        and isinstance(entry.get("etag"), (str, type(None)))
+        and isinstance(entry.get("result"), dict)
+        and isinstance(entry["result"].get("status"), str)
     )
-    return proc.stdout
+
+
+def _load_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the cache, dropping malformed entries so they read as misses."""
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: v for k, v in data.items() if _valid_entry(v)}
+
+
+def _save_cache(path: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, json.dumps(cache, indent=2, sort_keys=True).encode("utf-8"))
 
 
 def run(*, manifest: Dict[str, Any]) -> Dict[str, Any]:
-    gh_token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
-    env = os.environ.copy()
-    if gh_token:
-        env["GH_TOKEN"] = gh_token
+    token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
 
     critical = manifest.get("critical_workflows", {})
     repos: List[str] = sorted(critical.keys())
+    entries = [(repo, wf) for repo in repos for wf in critical.get(repo, [])]
+    # Each (repo, workflow) is looked up once even if the manifest repeats it.
+    pairs = list(dict.fromkeys(entries))
 
-    results: List[Dict[str, Any]] = []
-
-    for repo in repos:
-        workflows = critical.get(repo, [])
-        for wf_name in workflows:
-            # Use gh to list last few runs of this workflow by name
-            cmd = (
-                f'gh run list --repo "{repo}" '
-                f'--workflow "{wf_name}" '
-                f'--limit 1 --json databaseId,status,conclusion,createdAt,updatedAt'
-            )
-            out = _run(cmd, env)
-            try:
-                data = json.loads(out)
-            except Exception:
-                # gh prints errors as plain text; not JSON
-                results.append({
-                    "repo": repo,
-                    "workflow": wf_name,
-                    "status": "error",
-                    "raw_output": out.strip(),
-                })
-                continue
+    reports_dir = ROOT / manifest.get("reports_dir", "reports/guardians")
+    reports_dir.mkdir(parents=True, exist_ok=True)
 
-            if not data:
-                results.append({
-                    "repo": repo,
-                    "workflow": wf_name,
-                    "status": "no_runs",
-                })
-                continue
+    # Results younger than WF_CACHE_TTL are reused without touching the API;
+    # older ones keep their etag so the REST path can revalidate cheaply.
+    cache_path = reports_dir / WF_CACHE_NAME
+    cache = _load_cache(cache_path)
+    now = time.time()
+
+    results: List[Optional[Dict[str, Any]]] = []
+    stale: List[Tuple[int, str, str]] = []
+    for repo, wf_name in pairs:
+        entry = cache.get(f"{repo}::{wf_name}")
+        if entry and now - entry.get("fetched_at", 0) < WF_CACHE_TTL:
+            results.append(entry["result"])
+        else:
+            stale.append((len(results), repo, wf_name))
+            results.append(None)
+
+    # One GraphQL round trip covers every workflow that ran on a default-branch
+    # HEAD (GraphQL needs a token). Anything it doesn't see falls back to REST.
+    graph: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    stale_repos = sorted({repo for _, repo, _ in stale})
+    if token and stale_repos:
+        try:
+            graph = _graphql_latest_runs(stale_repos, token)
+        except Exception as e:
+            print(f"workflow_health: GraphQL batch failed, using REST: {e}")
 
-            last = data[0]
-            status = last.get("status")
-            conclusion = last.get("conclusion")
-            updated_at = last.get("updatedAt")
-
-            if conclusion == "success":
-                health = "healthy"
-            elif conclusion in ("failure", "cancelled", "timed_out", "stale"):
-                health = "failing"
-            else:
-                health = f"status:{status}, conclusion:{conclusion}"
-
-            results.append({
-                "repo": repo,
-                "workflow": wf_name,
-                "status": health,
-                "last_status": status,
-                "last_conclusion": conclusion,
-                "last_updated": updated_at,
-            })
+    pending: List[Tuple[int, str, str]] = []
+    for idx, repo, wf_name in stale:
+        found = graph.get(repo, {}).get(wf_name)
+        if found is not None:
+            results[idx] = res = _health(repo, wf_name, found)
+            cache[f"{repo}::{wf_name}"] = {"etag": None, "fetched_at": now, "result": res}
+        else:
+            pending.append((idx, repo, wf_name))
+
+    if pending:
+        # Resolve workflow ids for every repo up front, then queue each repo's
+        # run fetches as soon as its own ids arrive (in completion order), not
+        # behind earlier repos' lookups. Results are read back in manifest order.
+        by_repo: Dict[str, List[int]] = {}
+        for n, (_, repo, _) in enumerate(pending):
+            by_repo.setdefault(repo, []).append(n)
+        check_futs: List[Optional[Future]] = [None] * len(pending)
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+            id_futs = {
+                pool.submit(_resolve_ids, repo, token): repo for repo in sorted(by_repo)
+            }
+            for id_fut in as_completed(id_futs):
+                repo = id_futs[id_fut]
+                ids = id_fut.result()
+                for n in by_repo[repo]:
+                    wf_name = pending[n][2]
+                    check_futs[n] = pool.submit(
+                        _check, repo, wf_name, *ids, token, cache.get(f"{repo}::{wf_name}"),
+                    )
+            for (idx, repo, wf_name), fut in zip(pending, check_futs):
+                res, etag = fut.result()
+                results[idx] = res
+                if res["status"] != "error":
+                    cache[f"{repo}::{wf_name}"] = {
+                        "etag": etag,
+                        "fetched_at": now,
+                        "result": res,
+                    }
+
+    if stale:
+        _save_cache(cache_path, cache)
+
+    if len(pairs) != len(entries):
+        by_pair = dict(zip(pairs, results))
+        results = [by_pair[e] for e in entries]
 
     # Summarize
     total = len(results)
@@ -107,11 +346,12 @@ def run(*, manifest: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     # Write a detailed report file for this task
-    reports_dir = ROOT / manifest.get("reports_dir", "reports/guardians")
-    reports_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     report_path = reports_dir / f"workflow_health_{ts.replace(':','-')}.json"
-    report_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if orjson is not None:
+        write_atomic(report_path, orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        write_atomic(report_path, json.dumps(results, indent=2).encode("utf-8"))
 
     print("=== workflow_health ===")
     print(summary)
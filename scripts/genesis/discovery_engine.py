@@ -12,6 +12,7 @@ Does NOT move, rename, or delete any files (read-only).
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
@@ -27,12 +28,54 @@ EXPECTED_CONNECTIVITY_FILES = [
 ]
 
 
+# Below this many top-level directories the process pool costs more than it saves.
+PARALLEL_MIN_SUBTREES = 4
+
+
+def _walk_subtree(top: str) -> List[str]:
+    """Iterative scandir walk returning root-relative POSIX paths of all files."""
+    root_prefix = len(str(ROOT)) + 1
+    found: List[str] = []
+    stack = [top]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Match os.walk(followlinks=False): don't descend into symlinks.
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    found.append(entry.path[root_prefix:].replace(os.sep, "/"))
+    return found
+
+
 def scan_repo() -> Dict[str, List[str]]:
-    found = []
-    for dirpath, _, filenames in os.walk(ROOT):
-        for fname in filenames:
-            rel = Path(dirpath).joinpath(fname).relative_to(ROOT)
-            found.append(rel.as_posix())
+    found: List[str] = []
+    subtrees: List[str] = []
+    with os.scandir(ROOT) as it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subtrees.append(entry.path)
+            else:
+                found.append(entry.name)
+
+    if len(subtrees) < PARALLEL_MIN_SUBTREES:
+        for top in subtrees:
+            found.extend(_walk_subtree(top))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for files in pool.map(_walk_subtree, subtrees):
+                found.extend(files)
 
     return {"all_files": found}
 
@@ -67,37 +110,30 @@ def write_discovery_report(index: Dict[str, List[str]], connectivity_info: Dict[
     ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     path = REPORTS_DIR / f"discovery_{ts}.md"
 
-    lines = [
-        "# Genesis Discovery Report",
-        f"- Run: `{datetime.utcnow().isoformat()}Z`",
-        "",
-        "## Connectivity Summary",
-        "",
-        "### Present (expected files found)",
-    ]
-    if connectivity_info["present"]:
-        for p in connectivity_info["present"]:
-            lines.append(f"- `{p}`")
-    else:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("### Missing (expected files not found)")
-    if connectivity_info["missing"]:
-        for m in connectivity_info["missing"]:
-            lines.append(f"- `{m}`")
-    else:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("### Suspect Files (possibly misplaced/duplicate connectivity files)")
-    if connectivity_info["suspects"]:
-        for s in connectivity_info["suspects"]:
-            lines.append(f"- `{s}`")
-    else:
-        lines.append("- (none)")
+    sections = (
+        ("### Present (expected files found)", connectivity_info["present"]),
+        ("### Missing (expected files not found)", connectivity_info["missing"]),
+        (
+            "### Suspect Files (possibly misplaced/duplicate connectivity files)",
+            connectivity_info["suspects"],
+        ),
+    )
+    with path.open("w", encoding="utf-8") as f:
+        w = f.write
+        w("# Genesis Discovery Report\n")
+        w(f"- Run: `{datetime.utcnow().isoformat()}Z`\n\n")
+        w("## Connectivity Summary\n\n")
+        for i, (heading, items) in enumerate(sections):
+            if i:
+                w("\n")
+            w(heading)
+            w("\n")
+            if items:
+                for item in items:
+                    w(f"- `{item}`\n")
+            else:
+                w("- (none)\n")
 
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     print(f"[discovery_engine] Wrote discovery report: {path}")
 
 
@@ -13,6 +13,7 @@ Writes a consolidated dashboard to:
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -26,32 +27,43 @@ WALLET_DIR = ROOT / "ledger" / "telemetry" / "financial"
 FIN_REPORT_DIR = ROOT / "scripts" / "reports" / "financial"
 LEDGER_REPORT_DIR = ROOT / "scripts" / "reports" / "ledger"
 
+_GENERATED_AT_RE = re.compile(r"Generated at:\s*`([^`]+)`")
+# "Generated at" sits in the snapshot header; read only this much up front.
+_HEADER_BYTES = 2048
+
 
 @dataclass
 class WalletSnapshot:
   path: Path
   generated_at: str
-  body: str
 
 
 def latest_by_prefix(folder: Path, prefix: str) -> Optional[Path]:
-    if not folder.exists():
+    # Single scandir pass keeping the max name; no list, no sort.
+    best: Optional[os.DirEntry] = None
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.name.startswith(prefix) or not e.is_file():
+                    continue
+                if best is None or e.name > best.name:
+                    best = e
+    except FileNotFoundError:
         return None
-    candidates = sorted(
-        [p for p in folder.glob(f"{prefix}*") if p.is_file()],
-        key=lambda p: p.name,
-    )
-    return candidates[-1] if candidates else None
+    return Path(best.path) if best is not None else None
 
 
 def load_wallet() -> Optional[WalletSnapshot]:
     p = latest_by_prefix(WALLET_DIR, "wallet_snapshot_")
     if not p:
         return None
-    text = p.read_text(encoding="utf-8")
-    m = re.search(r"Generated at:\s*`([^`]+)`", text)
+    with p.open("r", encoding="utf-8") as f:
+        head = f.read(_HEADER_BYTES)
+        m = _GENERATED_AT_RE.search(head)
+        if m is None:
+            m = _GENERATED_AT_RE.search(head + f.read())
     ts = m.group(1) if m else "unknown"
-    return WalletSnapshot(path=p, generated_at=ts, body=text)
+    return WalletSnapshot(path=p, generated_at=ts)
 
 
 def load_latest_file(folder: Path, prefix: str) -> Optional[Path]:
@@ -107,7 +119,8 @@ def main() -> None:
     lines.append("- Future versions may inline summaries / KPIs here.")
     lines.append("")
 
-    out.write_text("\n".join(lines), encoding="utf-8")
+    # Single encode + single write() of the whole rollup.
+    out.write_bytes("\n".join(lines).encode("utf-8"))
     print(
         f"Wrote daily rollup to {out.relative_to(ROOT)}"
     )
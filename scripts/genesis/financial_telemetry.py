@@ -20,6 +20,13 @@ import json
 import os
 from pathlib import Path
 
+from genesis_common import write_atomic
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 LEDGER_ROOT = ROOT / "ledger" / "telemetry" / "financial"
 
@@ -71,7 +78,8 @@ def evaluate_status(cfg: dict) -> dict:
     }
 
 
-def write_markdown(summary: dict, ts_iso: str, day: str, base: Path) -> Path:
+def render_markdown(summary: dict, ts_iso: str) -> str:
+    """Render the markdown ledger entry (no I/O)."""
     lines = [
         "# StegVerse Financial Telemetry",
         "",
@@ -89,17 +97,29 @@ def write_markdown(summary: dict, ts_iso: str, day: str, base: Path) -> Path:
         "## Status",
         f"- State: **{summary['status']}**",
         f"- Notes: {summary['notes']}",
+        "",
     ]
+    return "\n".join(lines)
+
+
+def render_json(summary: dict, ts_iso: str) -> bytes:
+    """Render the JSON mirror as UTF-8 bytes (no I/O)."""
+    payload = dict(summary)
+    payload["generated_at"] = ts_iso
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_markdown(summary: dict, ts_iso: str, day: str, base: Path) -> Path:
     md_path = base / f"daily_{day}.md"
-    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_atomic(md_path, render_markdown(summary, ts_iso).encode("utf-8"))
     return md_path
 
 
 def write_json(summary: dict, ts_iso: str, day: str, base: Path) -> Path:
-    payload = dict(summary)
-    payload["generated_at"] = ts_iso
     json_path = base / f"daily_{day}.json"
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_atomic(json_path, render_json(summary, ts_iso))
     return json_path
 
 
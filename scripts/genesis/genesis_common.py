@@ -0,0 +1,161 @@
+"""
+StegVerse Genesis - helpers shared by the genesis scripts.
+
+The scripts run as `python scripts/genesis/<name>.py`, which puts this
+directory on sys.path, so they import this module as a plain sibling:
+
+  from genesis_common import write_atomic
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import ijson  # optional: streaming JSON parse, json.load otherwise
+except Exception:
+    ijson = None
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed, much faster
+except ImportError:
+    try:
+        from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+    except ImportError:  # PyYAML missing; only the YAML-reading scripts need it
+        _SafeLoader = None  # type: ignore[assignment,misc]
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a sibling temp file, fsync it, then rename it over `path`,
+    so concurrent readers see either the old file or the new one, never a
+    partial write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_json_sibling(p: Path, raw: bytes) -> Optional[Dict[str, Any]]:
+    """
+    The JSON mirror of a YAML config (see yaml_to_json.py), if it was built
+    from exactly these YAML bytes; None means parse the YAML instead.
+    """
+    try:
+        mirror = json.loads(p.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(mirror, dict):
+        return None
+    if mirror.get("source_sha256") != hashlib.sha256(raw).hexdigest():
+        return None
+    return mirror.get("data")
+
+
+# ---------------------------------------------------------------------------
+# Input markers
+# ---------------------------------------------------------------------------
+
+# First line of a generated report: hash of the inputs it was built from, so
+# a rerun on unchanged inputs can leave the report (and its git history) alone.
+INPUT_MARKER = "<!-- input_sha256: {} -->\n"
+
+
+def read_input_marker(path: Path) -> Optional[str]:
+    """The input hash recorded on the first line of `path`, if any."""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            line = f.readline()
+    except OSError:
+        return None
+    prefix, _, rest = INPUT_MARKER.partition("{}")
+    if line.startswith(prefix) and line.endswith(rest):
+        return line[len(prefix):-len(rest)]
+    return None
+
+
+# ---------------------------------------------------------------------------
+# guardian_run_latest.json
+# ---------------------------------------------------------------------------
+
+_RUN_KEYS = ("run_id", "generated_at")
+_TASK_KEYS = ("id", "status", "summary")
+
+
+def _prune_task(task: Dict[str, Any], detail_keys: Sequence[str]) -> Dict[str, Any]:
+    kept = {k: task[k] for k in _TASK_KEYS if k in task}
+    details = task.get("details")
+    if isinstance(details, dict):
+        kept["details"] = {k: details[k] for k in detail_keys if k in details}
+    return kept
+
+
+def _sort_details(data: Dict[str, Any], sorted_keys: Sequence[str]) -> None:
+    for task in data.get("tasks") or []:
+        details = task.get("details") if isinstance(task, dict) else None
+        if not isinstance(details, dict):
+            continue
+        for k in sorted_keys:
+            if isinstance(details.get(k), list):
+                details[k].sort()
+
+
+def load_guardian_run(
+    path: Path, detail_keys: Sequence[str], sorted_keys: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Load a guardian run JSON in a pruned shape that does not depend on
+    whether ijson is installed: top-level `run_id`/`generated_at` (when they
+    are strings or numbers) plus `tasks`, each task keeping only
+    id/status/summary and the `detail_keys` details. The `sorted_keys`
+    detail lists come back sorted in place, once.
+    """
+    if ijson is None:
+        with path.open("r", encoding="utf-8") as f:
+            raw = json.load(f)
+        if not isinstance(raw, dict):
+            raw = {}
+        data = {
+            k: raw[k] for k in _RUN_KEYS
+            if isinstance(raw.get(k), (str, int, float)) and not isinstance(raw[k], bool)
+        }
+        tasks = raw.get("tasks")
+        data["tasks"] = [
+            _prune_task(t, detail_keys)
+            for t in (tasks if isinstance(tasks, list) else [])
+            if isinstance(t, dict)
+        ]
+        _sort_details(data, sorted_keys)
+        return data
+
+    # Streamed: one event pass for the top-level scalars, one for the tasks.
+    data = {}
+    with path.open("rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in _RUN_KEYS and event in ("string", "number"):
+                data[prefix] = value
+    with path.open("rb") as f:
+        data["tasks"] = [
+            _prune_task(t, detail_keys)
+            for t in ijson.items(f, "tasks.item", use_float=True)
+            if isinstance(t, dict)
+        ]
+    _sort_details(data, sorted_keys)
+    return data
+
+
+def norm_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """A task with id/status/summary/details defaulted and status lowercased."""
+    return {
+        "id": task.get("id") or "unknown",
+        "status": (task.get("status") or "").strip().lower(),
+        "summary": (task.get("summary") or "").strip(),
+        "details": task.get("details") or {},
+    }
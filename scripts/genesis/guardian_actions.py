@@ -15,143 +15,168 @@ Goal:
 
 from __future__ import annotations
 
-import json
+import hashlib
+import io
 from pathlib import Path
 from typing import Any, Dict, List
 
+from genesis_common import INPUT_MARKER, load_guardian_run, norm_task, read_input_marker
+
 ROOT = Path(__file__).resolve().parents[2]  # .../StegVerse-SCW
 REPORT_DIR = ROOT / "reports" / "guardians"
 LATEST_JSON = REPORT_DIR / "guardian_run_latest.json"
 ACTIONS_MD = REPORT_DIR / "guardian_actions.md"
 
 
+# Task details read below; the listed ones are rendered in sorted order.
+_DETAIL_KEYS = ("readme_present", "readme_missing", "workflow_files", "count")
+_SORTED_KEYS = ("readme_present", "readme_missing", "workflow_files")
+
+
 def load_latest_run() -> Dict[str, Any]:
     if not LATEST_JSON.exists():
         raise SystemExit(f"Latest guardian JSON not found: {LATEST_JSON}")
-    with LATEST_JSON.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_guardian_run(LATEST_JSON, _DETAIL_KEYS, _SORTED_KEYS)
 
 
-def summarize_readme_refresh(task: Dict[str, Any]) -> List[str]:
-    lines: List[str] = []
-    details = task.get("details") or {}
+def summarize_readme_refresh(task: Dict[str, Any]) -> str:
+    buf = io.StringIO()
+    w = buf.write
+    details = task["details"]
     present = details.get("readme_present") or []
     missing = details.get("readme_missing") or []
 
-    lines.append("### README Refresh")
-    lines.append(f"- Status: **{task.get('status', 'unknown')}**")
-    lines.append(f"- Summary: {task.get('summary', '').strip() or '(no summary)'}")
-    lines.append("")
+    w("### README Refresh\n")
+    w(f"- Status: **{task['status']}**\n")
+    w(f"- Summary: {task['summary'] or '(no summary)'}\n")
+    w("\n")
 
     if present:
-        lines.append("Readme already present in:")
-        for p in sorted(present):
-            lines.append(f"- `{p}`")
-        lines.append("")
+        w("Readme already present in:\n")
+        for p in present:
+            w(f"- `{p}`\n")
+        w("\n")
 
     if missing:
-        lines.append("Readme missing in directories (high priority for docs workers):")
-        for d in sorted(missing):
-            lines.append(f"- `{d}`")
-        lines.append("")
-        lines.append("Suggested next actions:")
-        lines.append("- [ ] Create minimal README.md in each missing directory.")
-        lines.append("- [ ] For key folders (e.g., `scripts/genesis`, `ledger/telemetry`), add purpose, key scripts, and how to run checks.")
-        lines.append("")
-
-    return lines
-
-
-def summarize_workflow_health(task: Dict[str, Any]) -> List[str]:
-    lines: List[str] = []
-    details = task.get("details") or {}
+        w("Readme missing in directories (high priority for docs workers):\n")
+        for d in missing:
+            w(f"- `{d}`\n")
+        w("\n")
+        w("Suggested next actions:\n")
+        w("- [ ] Create minimal README.md in each missing directory.\n")
+        w("- [ ] For key folders (e.g., `scripts/genesis`, `ledger/telemetry`), add purpose, key scripts, and how to run checks.\n")
+        w("\n")
+
+    return buf.getvalue()
+
+
+def summarize_workflow_health(task: Dict[str, Any]) -> str:
+    buf = io.StringIO()
+    w = buf.write
+    details = task["details"]
     wf_files = details.get("workflow_files") or []
     count = details.get("count", len(wf_files))
 
-    lines.append("### Workflow Health")
-    lines.append(f"- Status: **{task.get('status', 'unknown')}**")
-    lines.append(f"- Summary: {task.get('summary', '').strip() or '(no summary)'}")
-    lines.append("")
-    lines.append(f"Detected **{count}** workflow file(s):")
-    for name in sorted(wf_files):
-        lines.append(f"- `{name}`")
-    lines.append("")
+    w("### Workflow Health\n")
+    w(f"- Status: **{task['status']}**\n")
+    w(f"- Summary: {task['summary'] or '(no summary)'}\n")
+    w("\n")
+    w(f"Detected **{count}** workflow file(s):\n")
+    for name in wf_files:
+        w(f"- `{name}`\n")
+    w("\n")
 
-    lines.append("Suggested next actions:")
-    lines.append("- [ ] Confirm each workflow is visible in GitHub Actions UI and has a trigger (`workflow_dispatch`, `schedule`, or `push`).")
-    lines.append("- [ ] Mark the highest-priority workflows for 24/7 uptime (to be guarded by future AI workers).")
-    lines.append("")
-    return lines
+    w("Suggested next actions:\n")
+    w("- [ ] Confirm each workflow is visible in GitHub Actions UI and has a trigger (`workflow_dispatch`, `schedule`, or `push`).\n")
+    w("- [ ] Mark the highest-priority workflows for 24/7 uptime (to be guarded by future AI workers).\n")
+    w("\n")
+    return buf.getvalue()
 
 
 def main() -> int:
     print("=== StegVerse Guardian Actions (Genesis v0.1) ===")
+    if not LATEST_JSON.exists():
+        raise SystemExit(f"Latest guardian JSON not found: {LATEST_JSON}")
+    h = hashlib.sha256()
+    with LATEST_JSON.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    in_sha = h.hexdigest()
+    # The plan's first line records the hash of the JSON it was built from.
+    if read_input_marker(ACTIONS_MD) == in_sha:
+        print(f"Guardian actions plan up-to-date: {ACTIONS_MD}")
+        return 0
+
     data = load_latest_run()
 
     run_id = data.get("run_id", "unknown")
     generated_at = data.get("generated_at", "unknown")
-    tasks = data.get("tasks") or []
+    tasks = [norm_task(t) for t in data.get("tasks") or []]
 
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
 
-    lines: List[str] = []
-    lines.append("# StegVerse Guardian Action Plan")
-    lines.append("")
-    lines.append(f"- Based on guardian run: `{run_id}`")
-    lines.append(f"- Generated at: `{generated_at}`")
-    lines.append("")
-    lines.append("This file is the **bridge** between guardian scans and future AI workers.")
-    lines.append("Guardians detect issues; this plan shows what should be done next.")
-    lines.append("")
-
-    if not tasks:
-        lines.append("_No tasks found in latest guardian run._")
-    else:
-        # Group tasks: warnings first, then ok, then others
-        warnings: List[Dict[str, Any]] = []
-        oks: List[Dict[str, Any]] = []
-        others: List[Dict[str, Any]] = []
-
-        for t in tasks:
-            status = (t.get("status") or "").lower()
-            if status in ("warning", "error"):
-                warnings.append(t)
-            elif status == "ok":
-                oks.append(t)
-            else:
-                others.append(t)
-
-        if warnings:
-            lines.append("## High-priority findings (warnings / errors)")
-            lines.append("")
-            for t in warnings:
-                tid = t.get("id", "unknown")
-                if tid == "readme_refresh":
-                    lines.extend(summarize_readme_refresh(t))
-                elif tid == "workflow_health":
-                    lines.extend(summarize_workflow_health(t))
+    # Encoded straight into the buffered file, never held whole.
+    with ACTIONS_MD.open("wb") as fh:
+        def w(text: str) -> None:
+            fh.write(text.encode("utf-8"))
+
+        w(INPUT_MARKER.format(in_sha))
+        w("# StegVerse Guardian Action Plan\n")
+        w("\n")
+        w(f"- Based on guardian run: `{run_id}`\n")
+        w(f"- Generated at: `{generated_at}`\n")
+        w("\n")
+        w("This file is the **bridge** between guardian scans and future AI workers.\n")
+        w("Guardians detect issues; this plan shows what should be done next.\n")
+        w("\n")
+
+        if not tasks:
+            w("_No tasks found in latest guardian run._\n")
+        else:
+            # Group tasks: warnings first, then ok, then others
+            warnings: List[Dict[str, Any]] = []
+            oks: List[Dict[str, Any]] = []
+            others: List[Dict[str, Any]] = []
+
+            for t in tasks:
+                status = t["status"]
+                if status in ("warning", "error"):
+                    warnings.append(t)
+                elif status == "ok":
+                    oks.append(t)
                 else:
-                    lines.append(f"### `{tid}`")
-                    lines.append(f"- Status: **{t.get('status', 'unknown')}**")
-                    lines.append(f"- Summary: {t.get('summary', '').strip() or '(no summary)'}")
-                    lines.append("")
-            lines.append("")
-
-        if oks:
-            lines.append("## Healthy guardian checks")
-            lines.append("")
-            for t in oks:
-                lines.append(f"- `{t.get('id', 'unknown')}` — **ok** — {t.get('summary', '').strip() or '(no summary)'}")
-            lines.append("")
-
-        if others:
-            lines.append("## Other guardian results")
-            lines.append("")
-            for t in others:
-                lines.append(f"- `{t.get('id', 'unknown')}` — status: **{t.get('status', 'unknown')}** — {t.get('summary', '').strip() or '(no summary)'}")
-            lines.append("")
-
-    ACTIONS_MD.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                    others.append(t)
+
+            if warnings:
+                w("## High-priority findings (warnings / errors)\n")
+                w("\n")
+                for t in warnings:
+                    tid = t["id"]
+                    if tid == "readme_refresh":
+                        w(summarize_readme_refresh(t))
+                    elif tid == "workflow_health":
+                        w(summarize_workflow_health(t))
+                    else:
+                        w(f"### `{tid}`\n")
+                        w(f"- Status: **{t['status']}**\n")
+                        w(f"- Summary: {t['summary'] or '(no summary)'}\n")
+                        w("\n")
+                w("\n")
+
+            if oks:
+                w("## Healthy guardian checks\n")
+                w("\n")
+                for t in oks:
+                    w(f"- `{t['id']}` — **ok** — {t['summary'] or '(no summary)'}\n")
+                w("\n")
+
+            if others:
+                w("## Other guardian results\n")
+                w("\n")
+                for t in others:
+                    w(f"- `{t['id']}` — status: **{t['status']}** — {t['summary'] or '(no summary)'}\n")
+                w("\n")
+
     print(f"Wrote guardian actions plan to: {ACTIONS_MD}")
     print("=== Guardian Actions completed. ===")
     return 0
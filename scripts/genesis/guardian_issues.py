@@ -6,7 +6,8 @@ Reads:
   - reports/guardians/guardian_run_latest.json
 
 Maintains:
-  - reports/guardians/guardian_issues_index.json
+  - reports/guardians/guardian_issues_index.json   (snapshot)
+  - reports/guardians/guardian_issues_index.jsonl  (changes since snapshot)
 
 Creates/updates GitHub issues for guardian findings, using stable "keys"
 so we don't open duplicates on each run.
@@ -18,46 +19,156 @@ Current scope:
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests  # installed by guardians workflow
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from genesis_common import load_guardian_run, norm_task
+
+try:
+    import orjson  # optional: faster JSON serialize, stdlib json otherwise
+except Exception:
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parents[2]  # .../StegVerse-SCW
 REPORT_DIR = ROOT / "reports" / "guardians"
 LATEST_JSON = REPORT_DIR / "guardian_run_latest.json"
 ISSUE_INDEX_JSON = REPORT_DIR / "guardian_issues_index.json"
+ISSUE_INDEX_LOG = REPORT_DIR / "guardian_issues_index.jsonl"
+
+# Issues reconciled over REST at once (creations and GraphQL fallbacks).
+MAX_ISSUE_WORKERS = 8
+
+# One keep-alive session for every GitHub call: the TLS handshake is paid
+# once per run, and transient gateway errors are retried with backoff.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+SESSION.headers.update({
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+})
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Task details the issue builders use; list details come back sorted.
+_DETAIL_KEYS = ("readme_missing", "workflow_files", "count")
+_SORTED_KEYS = ("readme_missing", "workflow_files")
+
+
 def load_latest_run() -> Dict[str, Any]:
     if not LATEST_JSON.exists():
         raise SystemExit(f"Latest guardian JSON not found: {LATEST_JSON}")
-    with LATEST_JSON.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_guardian_run(LATEST_JSON, _DETAIL_KEYS, _SORTED_KEYS)
+
+
+# The index is a JSON snapshot plus an append-only JSONL log of entries
+# changed since; each log line is a full entry ({"key", "ts", ...fields}),
+# so replaying it over the snapshot is idempotent. Saving appends only the
+# entries that changed and folds the log back into the snapshot once it
+# holds more than COMPACT_FACTOR lines per key.
+COMPACT_FACTOR = 2
+
+# Encoded entries as last persisted, the current log length, and whether
+# the log's last line lacks its newline (an interrupted append).
+_persisted: Dict[str, bytes] = {}
+_log_lines = 0
+_log_torn = False
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 def load_issue_index() -> Dict[str, Any]:
-    if not ISSUE_INDEX_JSON.exists():
-        return {"version": 1, "issues": {}}
-    with ISSUE_INDEX_JSON.open("r", encoding="utf-8") as f:
-        data = json.load(f) or {}
-    if "issues" not in data:
-        data["issues"] = {}
+    global _log_lines, _log_torn
+    data: Dict[str, Any] = {"version": 1, "issues": {}}
+    if ISSUE_INDEX_JSON.exists():
+        with ISSUE_INDEX_JSON.open("r", encoding="utf-8") as f:
+            data = json.load(f) or {}
+        if "issues" not in data:
+            data["issues"] = {}
+    issues = data["issues"]
+
+    _log_lines = 0
+    _log_torn = False
+    if ISSUE_INDEX_LOG.exists():
+        with ISSUE_INDEX_LOG.open("rb") as f:
+            for line in f:
+                _log_torn = not line.endswith(b"\n")
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                _log_lines += 1
+                key = event.pop("key", None)
+                event.pop("ts", None)
+                if key:
+                    issues[key] = event
+
+    _persisted.clear()
+    _persisted.update((k, _dumps(v)) for k, v in issues.items())
     return data
 
 
+def _write_snapshot(idx: Dict[str, Any]) -> None:
+    tmp = ISSUE_INDEX_JSON.with_suffix(".json.tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(idx, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(idx, f, indent=2, sort_keys=True)
+    os.replace(tmp, ISSUE_INDEX_JSON)
+
+
 def save_issue_index(idx: Dict[str, Any]) -> None:
+    global _log_lines, _log_torn
     ISSUE_INDEX_JSON.parent.mkdir(parents=True, exist_ok=True)
-    with ISSUE_INDEX_JSON.open("w", encoding="utf-8") as f:
-        json.dump(idx, f, indent=2, sort_keys=True)
+    issues = idx.get("issues") or {}
+
+    ts = datetime.now(timezone.utc).isoformat()
+    lines: List[bytes] = []
+    for key, entry in issues.items():
+        encoded = _dumps(entry)
+        if _persisted.get(key) != encoded:
+            lines.append(_dumps(dict(entry, key=key, ts=ts)) + b"\n")
+            _persisted[key] = encoded
+    if lines:
+        if _log_torn:
+            lines.insert(0, b"\n")
+            _log_torn = False
+        with ISSUE_INDEX_LOG.open("ab") as f:
+            f.write(b"".join(lines))
+        _log_lines += len(lines)
+
+    if _log_lines > COMPACT_FACTOR * max(len(issues), 1):
+        # Snapshot first, then drop the log: a crash in between only
+        # replays entries the snapshot already has.
+        _write_snapshot(idx)
+        ISSUE_INDEX_LOG.unlink()
+        _log_lines = 0
 
 
 def get_repo_and_token() -> (str, str, str):
@@ -77,19 +188,38 @@ def gh_api(
     path: str,
     token: str,
     json_body: Optional[Dict[str, Any]] = None,
+    etag: Optional[str] = None,
 ) -> requests.Response:
     url = f"https://api.github.com{path}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    resp = requests.request(method, url, headers=headers, json=json_body, timeout=20)
+    headers = {"Authorization": f"Bearer {token}"}
+    if etag:
+        # Conditional request: GitHub answers 304 (no body) when unchanged.
+        headers["If-None-Match"] = etag
+    resp = SESSION.request(method, url, headers=headers, json=json_body, timeout=20)
     if resp.status_code >= 400:
         raise RuntimeError(f"GitHub API {method} {path} failed: {resp.status_code} {resp.text}")
     return resp
 
 
+def gh_graphql(query: str, variables: Dict[str, Any], token: str) -> Optional[Dict[str, Any]]:
+    """POST one GraphQL document; returns its data, or None on any error."""
+    try:
+        resp = SESSION.post(
+            "https://api.github.com/graphql",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"query": query, "variables": variables},
+            timeout=20,
+        )
+    except requests.RequestException:
+        return None
+    if resp.status_code != 200:
+        return None
+    body = resp.json()
+    if body.get("errors"):
+        return None
+    return body.get("data")
+
+
 def ensure_issue(
     *,
     key: str,
@@ -105,9 +235,14 @@ def ensure_issue(
     Ensure there is a single GitHub issue associated with this logical "key".
     - If not present in index -> create new issue and record it.
     - If present -> update body (and reopen if closed).
+
+    The index remembers the body hash, ETag and state last seen, so an
+    unchanged body on an open issue costs no API calls, and a changed one
+    only a conditional GET plus the PATCH.
     """
     issues_idx = idx.setdefault("issues", {})
     existing = issues_idx.get(key)
+    body_sha1 = hashlib.sha1(body.encode("utf-8")).hexdigest()
 
     if existing:
         issue_number = existing.get("number")
@@ -115,19 +250,33 @@ def ensure_issue(
             existing = None
 
     if existing:
-        # Fetch issue state
+        if existing.get("body_sha1") == body_sha1 and existing.get("state") == "open":
+            print(f"Guardian issue #{issue_number} for key={key} unchanged; skipped")
+            return idx
+
+        # Fetch issue state (304 -> unchanged since we last saw it)
         path = f"/repos/{owner}/{repo}/issues/{issue_number}"
-        resp = gh_api("GET", path, token)
-        data = resp.json()
-        state = data.get("state", "open")
+        resp = gh_api("GET", path, token, etag=existing.get("etag"))
+        if resp.status_code == 304:
+            state = existing.get("state", "open")
+        else:
+            state = resp.json().get("state", "open")
+            existing["etag"] = resp.headers.get("ETag")
+        existing["state"] = state
+
+        if existing.get("body_sha1") == body_sha1 and state == "open":
+            print(f"Guardian issue #{issue_number} for key={key} unchanged; skipped")
+            return idx
 
         patch_body = {"body": body}
         if state == "closed":
             patch_body["state"] = "open"
 
-        gh_api("PATCH", path, token, patch_body)
-        issues_idx[key]["last_updated_body_len"] = len(body)
-        issues_idx[key]["state"] = "open"
+        resp = gh_api("PATCH", path, token, patch_body)
+        existing["last_updated_body_len"] = len(body)
+        existing["state"] = "open"
+        existing["body_sha1"] = body_sha1
+        existing["etag"] = resp.headers.get("ETag")
         print(f"Updated guardian issue #{issue_number} for key={key}")
         return idx
 
@@ -147,110 +296,211 @@ def ensure_issue(
         "state": "open",
         "title": title,
         "labels": labels,
+        "body_sha1": body_sha1,
+        "etag": resp.headers.get("ETag"),
     }
     print(f"Created new guardian issue #{issue_number} for key={key}")
     return idx
 
 
+def ensure_issues_batch(
+    specs: List[Dict[str, Any]],
+    idx: Dict[str, Any],
+    owner: str,
+    repo: str,
+    token: str,
+) -> Dict[str, Any]:
+    """
+    ensure_issue() for several specs, with the updates batched: one GraphQL
+    query for the node id/state of every known issue whose body changed, and
+    one aliased updateIssue mutation for all of them. Unchanged open issues
+    cost nothing. New keys, and any specs a failed GraphQL call left behind,
+    go through ensure_issue() over REST, concurrently.
+    """
+    issues_idx = idx.setdefault("issues", {})
+    rest: List[Dict[str, Any]] = []
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any], str]] = []
+    for spec in specs:
+        key = spec["key"]
+        entry = issues_idx.get(key)
+        if not entry or not entry.get("number"):
+            rest.append(spec)
+            continue
+        body_sha1 = hashlib.sha1(spec["body"].encode("utf-8")).hexdigest()
+        if entry.get("body_sha1") == body_sha1 and entry.get("state") == "open":
+            print(f"Guardian issue #{entry['number']} for key={key} unchanged; skipped")
+            continue
+        pending.append((spec, entry, body_sha1))
+    if pending:
+        done = _update_issues_graphql(pending, owner, repo, token)
+        rest.extend(spec for spec, _, _ in pending if spec["key"] not in done)
+
+    # Each spec touches only its own index key, and the session's connection
+    # pool is shared safely between threads.
+    def reconcile(spec: Dict[str, Any]) -> None:
+        ensure_issue(idx=idx, owner=owner, repo=repo, token=token, **spec)
+
+    if len(rest) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_ISSUE_WORKERS, len(rest))) as ex:
+            list(ex.map(reconcile, rest))
+    else:
+        for spec in rest:
+            reconcile(spec)
+    return idx
+
+
+def _update_issues_graphql(
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any], str]],
+    owner: str,
+    repo: str,
+    token: str,
+) -> Set[str]:
+    """Apply (spec, index entry, body sha1) updates via GraphQL; returns the keys done."""
+    lookups = " ".join(
+        f"i{i}: issue(number: {entry['number']}) {{ id state }}"
+        for i, (_, entry, _) in enumerate(pending)
+    )
+    data = gh_graphql(
+        "query($owner: String!, $name: String!) "
+        f"{{ repository(owner: $owner, name: $name) {{ {lookups} }} }}",
+        {"owner": owner, "name": repo},
+        token,
+    )
+    nodes = (data or {}).get("repository") or {}
+
+    params: List[str] = []
+    updates: List[str] = []
+    variables: Dict[str, Any] = {}
+    batched: List[Tuple[Dict[str, Any], Dict[str, Any], str]] = []
+    for i, item in enumerate(pending):
+        node = nodes.get(f"i{i}")
+        if not node:
+            continue
+        params.append(f"$id{i}: ID!, $body{i}: String!")
+        updates.append(
+            f"u{i}: updateIssue(input: {{id: $id{i}, body: $body{i}, state: OPEN}}) "
+            "{ issue { number } }"
+        )
+        variables[f"id{i}"] = node["id"]
+        variables[f"body{i}"] = item[0]["body"]
+        batched.append(item)
+
+    if batched and gh_graphql(
+        f"mutation({', '.join(params)}) {{ {' '.join(updates)} }}", variables, token
+    ) is not None:
+        for spec, entry, body_sha1 in batched:
+            entry["last_updated_body_len"] = len(spec["body"])
+            entry["state"] = "open"
+            entry["body_sha1"] = body_sha1
+            entry["etag"] = None  # GraphQL gives no ETag; next REST GET is unconditional
+            print(f"Updated guardian issue #{entry['number']} for key={spec['key']}")
+        return {spec["key"] for spec, _, _ in batched}
+    return set()
+
+
 # ---------------------------------------------------------------------------
 # Issue generators for specific guardian tasks
 # ---------------------------------------------------------------------------
 
-def build_readme_missing_issue(run_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def build_readme_missing_issue(
+    run_data: Dict[str, Any], task: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
     """
     From the readme_refresh task, construct a single issue if there are
     missing README directories.
     """
-    for task in run_data.get("tasks", []):
-        if task.get("id") == "readme_refresh":
-            status = (task.get("status") or "").lower()
-            details = task.get("details") or {}
-            missing = details.get("readme_missing") or []
-            if not missing:
-                return None
-
-            summary = task.get("summary", "").strip()
-            run_id = run_data.get("run_id", "unknown")
-            generated_at = run_data.get("generated_at", "unknown")
-
-            lines: List[str] = []
-            lines.append("Guardian task `readme_refresh` detected directories missing `README.md`.")
-            lines.append("")
-            lines.append(f"- Guardian run ID: `{run_id}`")
-            lines.append(f"- Generated at: `{generated_at}`")
-            lines.append(f"- Guardian status: **{status}**")
-            if summary:
-                lines.append(f"- Guardian summary: {summary}")
-            lines.append("")
-            lines.append("## Directories missing README.md")
-            lines.append("")
-            for d in sorted(missing):
-                lines.append(f"- [ ] `{d}`")
-            lines.append("")
-            lines.append("## Suggested actions")
-            lines.append("")
-            lines.append("- For each directory, create a `README.md` that includes:")
-            lines.append("  - Purpose of the folder")
-            lines.append("  - Key files / scripts")
-            lines.append("  - How to run or use them (if applicable)")
-            lines.append("")
-            lines.append("_This issue is managed by StegVerse guardians; editing the list above is safe._")
-
-            return {
-                "key": "readme_refresh_missing",
-                "title": "[Guardian] Missing README.md in key directories",
-                "body": "\n".join(lines),
-                "labels": ["guardian", "documentation"],
-            }
-    return None
-
-
-def build_workflow_health_issue(run_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if task is None:
+        return None
+    status = task["status"]
+    details = task["details"]
+    missing = details.get("readme_missing") or []
+    if not missing:
+        return None
+
+    summary = task["summary"]
+    run_id = run_data.get("run_id", "unknown")
+    generated_at = run_data.get("generated_at", "unknown")
+
+    buf = io.StringIO()
+    w = buf.write
+    w("Guardian task `readme_refresh` detected directories missing `README.md`.\n")
+    w("\n")
+    w(f"- Guardian run ID: `{run_id}`\n")
+    w(f"- Generated at: `{generated_at}`\n")
+    w(f"- Guardian status: **{status}**\n")
+    if summary:
+        w(f"- Guardian summary: {summary}\n")
+    w("\n")
+    w("## Directories missing README.md\n")
+    w("\n")
+    for d in missing:
+        w(f"- [ ] `{d}`\n")
+    w("\n")
+    w("## Suggested actions\n")
+    w("\n")
+    w("- For each directory, create a `README.md` that includes:\n")
+    w("  - Purpose of the folder\n")
+    w("  - Key files / scripts\n")
+    w("  - How to run or use them (if applicable)\n")
+    w("\n")
+    w("_This issue is managed by StegVerse guardians; editing the list above is safe._\n")
+
+    return {
+        "key": "readme_refresh_missing",
+        "title": "[Guardian] Missing README.md in key directories",
+        "body": buf.getvalue()[:-1],
+        "labels": ["guardian", "documentation"],
+    }
+
+
+def build_workflow_health_issue(
+    run_data: Dict[str, Any], task: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
     """
     From the workflow_health task, open a tracking issue if there are warnings.
     """
-    for task in run_data.get("tasks", []):
-        if task.get("id") == "workflow_health":
-            status = (task.get("status") or "").lower()
-            if status == "ok":
-                return None  # no issue needed when healthy
-
-            details = task.get("details") or {}
-            workflow_files = details.get("workflow_files") or []
-            count = details.get("count", len(workflow_files))
-            summary = task.get("summary", "").strip()
-            run_id = run_data.get("run_id", "unknown")
-            generated_at = run_data.get("generated_at", "unknown")
-
-            lines: List[str] = []
-            lines.append("Guardian task `workflow_health` reported warnings about GitHub workflows.")
-            lines.append("")
-            lines.append(f"- Guardian run ID: `{run_id}`")
-            lines.append(f"- Generated at: `{generated_at}`")
-            lines.append(f"- Guardian status: **{status}**")
-            if summary:
-                lines.append(f"- Guardian summary: {summary}")
-            lines.append("")
-            lines.append(f"Detected **{count}** workflow file(s):")
-            lines.append("")
-            for name in sorted(workflow_files):
-                lines.append(f"- `{name}`")
-            lines.append("")
-            lines.append("## Suggested actions")
-            lines.append("")
-            lines.append("- [ ] Confirm each workflow has at least one trigger (`workflow_dispatch`, `schedule`, or `push`).")
-            lines.append("- [ ] Mark high-priority workflows that should be guarded for uptime.")
-            lines.append("- [ ] Retire or archive workflows that are obsolete or unused.")
-            lines.append("")
-            lines.append("_This issue is managed by StegVerse guardians; it may be updated automatically._")
-
-            return {
-                "key": "workflow_health_warning",
-                "title": "[Guardian] Workflow health warnings",
-                "body": "\n".join(lines),
-                "labels": ["guardian", "workflows"],
-            }
-    return None
+    if task is None:
+        return None
+    status = task["status"]
+    if status == "ok":
+        return None  # no issue needed when healthy
+
+    details = task["details"]
+    workflow_files = details.get("workflow_files") or []
+    count = details.get("count", len(workflow_files))
+    summary = task["summary"]
+    run_id = run_data.get("run_id", "unknown")
+    generated_at = run_data.get("generated_at", "unknown")
+
+    buf = io.StringIO()
+    w = buf.write
+    w("Guardian task `workflow_health` reported warnings about GitHub workflows.\n")
+    w("\n")
+    w(f"- Guardian run ID: `{run_id}`\n")
+    w(f"- Generated at: `{generated_at}`\n")
+    w(f"- Guardian status: **{status}**\n")
+    if summary:
+        w(f"- Guardian summary: {summary}\n")
+    w("\n")
+    w(f"Detected **{count}** workflow file(s):\n")
+    w("\n")
+    for name in workflow_files:
+        w(f"- `{name}`\n")
+    w("\n")
+    w("## Suggested actions\n")
+    w("\n")
+    w("- [ ] Confirm each workflow has at least one trigger (`workflow_dispatch`, `schedule`, or `push`).\n")
+    w("- [ ] Mark high-priority workflows that should be guarded for uptime.\n")
+    w("- [ ] Retire or archive workflows that are obsolete or unused.\n")
+    w("\n")
+    w("_This issue is managed by StegVerse guardians; it may be updated automatically._\n")
+
+    return {
+        "key": "workflow_health_warning",
+        "title": "[Guardian] Workflow health warnings",
+        "body": buf.getvalue()[:-1],
+        "labels": ["guardian", "workflows"],
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -267,11 +517,17 @@ def main() -> int:
     # Collect desired issues from current guardian run
     issue_specs: List[Dict[str, Any]] = []
 
-    readme_issue = build_readme_missing_issue(run_data)
+    # Index tasks by id once; the first task with a given id wins.
+    tasks_by_id: Dict[Any, Dict[str, Any]] = {}
+    for task in run_data.get("tasks") or []:
+        task = norm_task(task)
+        tasks_by_id.setdefault(task["id"], task)
+
+    readme_issue = build_readme_missing_issue(run_data, tasks_by_id.get("readme_refresh"))
     if readme_issue:
         issue_specs.append(readme_issue)
 
-    wf_issue = build_workflow_health_issue(run_data)
+    wf_issue = build_workflow_health_issue(run_data, tasks_by_id.get("workflow_health"))
     if wf_issue:
         issue_specs.append(wf_issue)
 
@@ -280,17 +536,7 @@ def main() -> int:
         save_issue_index(issue_index)
         return 0
 
-    for spec in issue_specs:
-        issue_index = ensure_issue(
-            key=spec["key"],
-            title=spec["title"],
-            body=spec["body"],
-            labels=spec["labels"],
-            idx=issue_index,
-            owner=owner,
-            repo=repo,
-            token=token,
-        )
+    issue_index = ensure_issues_batch(issue_specs, issue_index, owner, repo, token)
 
     save_issue_index(issue_index)
     print("Guardian issue index updated.")
@@ -17,12 +17,22 @@ Notes:
 """
 
 from __future__ import annotations
-import json, os, sys, time
+import hashlib, json, os, re, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from genesis_common import INPUT_MARKER, _SafeLoader, read_input_marker
+
+try:
+    import orjson  # optional: faster JSON serialize, stdlib json otherwise
+except Exception:
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[2]
 CFG_PATH = ROOT / "docs" / "governance" / "repo_alignment_expectations.yaml"
@@ -30,11 +40,27 @@ OUT_DIR = ROOT / "reports" / "guardians"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 API = "https://api.github.com"
+MAX_REPO_WORKERS = 8
+# Per-repo workflow text fetches on the REST fallback path.
+MAX_TEXT_WORKERS = 4
+
+# Results keyed on (repo, HEAD sha, what was asked): a repo with no new commits
+# answers every file/workflow question from disk. Oldest entries (by mtime)
+# are evicted once the directory passes CACHE_MAX_BYTES.
+CACHE_DIR = OUT_DIR / ".cache"
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# REST fallback: ETag per URL plus the body it validated (<sha1(url)>.body),
+# so an unchanged resource comes back as a bodiless 304.
+ETAGS_PATH = CACHE_DIR / "etags.json"
+_etags: Optional[Dict[str, str]] = None
+_etags_lock = threading.Lock()
 
 def load_cfg() -> Dict[str, Any]:
     if not CFG_PATH.exists():
         raise SystemExit(f"Missing config at {CFG_PATH}")
-    return yaml.safe_load(CFG_PATH.read_text(encoding="utf-8")) or {}
+    # Bytes: libyaml detects the encoding itself, no decode/re-encode.
+    return yaml.load(CFG_PATH.read_bytes(), Loader=_SafeLoader) or {}
 
 def gh_headers(token: str) -> Dict[str, str]:
     return {
@@ -44,24 +70,94 @@ def gh_headers(token: str) -> Dict[str, str]:
         "User-Agent": "StegVerse-Repo-Alignment-Check"
     }
 
-def api_get(url: str, token: str) -> requests.Response:
-    return requests.get(url, headers=gh_headers(token), timeout=30)
+_local = threading.local()
+
+def _session() -> requests.Session:
+    # One pooled session per worker thread: keep-alive across the calls for
+    # a repo without sharing a Session between threads.
+    # Transient gateway errors are retried with backoff by the adapter.
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        sess = _local.session = requests.Session()
+        sess.mount("https://", HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])))
+    return sess
+
+def _etag_body_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.body"
+
+# Statuses for which api_get returns a usable body: 304 is a revalidated
+# copy of an earlier 200.
+API_OK = (200, 304)
+
+def api_get(url: str, token: str) -> Tuple[int, Any]:
+    """
+    GET a GitHub REST URL and return (status, decoded JSON body or None).
+
+    Requests are conditional on the stored ETag; a 304 comes back as
+    (304, stored body), so callers can tell a cache hit from a fresh 200.
+    """
+    global _etags
+    with _etags_lock:
+        if _etags is None:
+            try:
+                _etags = json.loads(ETAGS_PATH.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                _etags = {}
+        etag = _etags.get(url)
+    body_path = _etag_body_path(url)
+    headers = gh_headers(token)
+    if etag and body_path.exists():
+        headers["If-None-Match"] = etag
+    r = _session().get(url, headers=headers, timeout=30)
+    if r.status_code == 304:
+        try:
+            raw = body_path.read_bytes()
+        except OSError:  # evicted in between
+            r = _session().get(url, headers=gh_headers(token), timeout=30)
+            return r.status_code, _json_body(r.content)
+        os.utime(body_path)
+        return 304, _json_body(raw)
+    new_etag = r.headers.get("ETag")
+    if r.status_code == 200 and new_etag:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = body_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(r.content)
+        os.replace(tmp, body_path)
+        with _etags_lock:
+            _etags[url] = new_etag
+    return r.status_code, _json_body(r.content)
+
+def _json_body(raw: bytes) -> Any:
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+def save_etags() -> None:
+    if not _etags:
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = ETAGS_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(_etags), encoding="utf-8")
+    os.replace(tmp, ETAGS_PATH)
 
 def file_exists(owner: str, repo: str, path: str, token: str) -> Tuple[bool, str]:
     url = f"{API}/repos/{owner}/{repo}/contents/{path}"
-    r = api_get(url, token)
-    if r.status_code == 200:
+    status, _ = api_get(url, token)
+    if status in API_OK:
         return True, "present"
-    if r.status_code == 404:
+    if status == 404:
         return False, "missing"
-    return False, f"error:{r.status_code}"
+    return False, f"error:{status}"
 
 def list_workflows(owner: str, repo: str, token: str) -> Tuple[List[str], str]:
     url = f"{API}/repos/{owner}/{repo}/contents/.github/workflows"
-    r = api_get(url, token)
-    if r.status_code != 200:
-        return [], f"error:{r.status_code}"
-    items = r.json()
+    status, items = api_get(url, token)
+    if status not in API_OK:
+        return [], f"error:{status}"
     paths = []
     for it in items if isinstance(items, list) else []:
         if it.get("type") == "file":
@@ -70,31 +166,297 @@ def list_workflows(owner: str, repo: str, token: str) -> Tuple[List[str], str]:
 
 def fetch_file_text(owner: str, repo: str, path: str, token: str) -> Tuple[str, str]:
     url = f"{API}/repos/{owner}/{repo}/contents/{path}"
-    r = api_get(url, token)
-    if r.status_code != 200:
-        return "", f"error:{r.status_code}"
-    data = r.json()
-    download_url = data.get("download_url")
+    status, data = api_get(url, token)
+    if status not in API_OK:
+        return "", f"error:{status}"
+    download_url = data.get("download_url") if isinstance(data, dict) else None
     if not download_url:
         return "", "no_download_url"
-    raw = requests.get(download_url, timeout=30)
+    raw = _session().get(download_url, timeout=30)
     if raw.status_code != 200:
         return "", f"raw_error:{raw.status_code}"
     return raw.text, "ok"
 
+# All trigger tokens the checks care about, found in one pass over the text.
+# `dispatch` stays a plain substring match (it also appears inline, e.g.
+# `on: [push, workflow_dispatch]`); the others must start a mapping key.
+_WF_TOKENS_RE = re.compile(
+    r"(?P<dispatch>workflow_dispatch)"
+    r"|(?P<schedule>^\s*schedule\s*:)"
+    r"|(?P<push>^\s*push\s*:)",
+    re.M,
+)
+
+def scan_workflow_tokens(yaml_text: str) -> Dict[str, bool]:
+    found = dict.fromkeys(_WF_TOKENS_RE.groupindex, False)
+    remaining = len(found)
+    for m in _WF_TOKENS_RE.finditer(yaml_text):
+        if not found[m.lastgroup]:
+            found[m.lastgroup] = True
+            remaining -= 1
+            if not remaining:
+                break
+    return found
+
 def has_workflow_dispatch(yaml_text: str) -> bool:
     # text-level check is enough
-    return "workflow_dispatch" in yaml_text
+    return scan_workflow_tokens(yaml_text)["dispatch"]
+
+def fetch_repo_alignment(
+    owner: str, repo: str, required_files: List[str], want_texts: bool, token: str
+) -> Optional[Dict[str, Any]]:
+    """
+    One GraphQL round trip for everything the file/workflow checks need:
+    existence of each required path on HEAD, the .github/workflows listing,
+    and (if `want_texts`) each workflow's text.
+
+    Returns {"files": {path: (ok, msg)}, "workflows": (paths, msg),
+    "texts": {path: text}} using the same messages as the REST helpers, or
+    None if the query failed or reported any errors (callers then fall back
+    to REST).
+    """
+    fields = [
+        f"f{i}: object(expression: {json.dumps('HEAD:' + f)}) {{ __typename }}"
+        for i, f in enumerate(required_files)
+    ]
+    blob = " object { ... on Blob { text } }" if want_texts else ""
+    fields.append(
+        'wf: object(expression: "HEAD:.github/workflows") '
+        f"{{ ... on Tree {{ entries {{ name type{blob} }} }} }}"
+    )
+    query = (
+        f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+        f"{{ {' '.join(fields)} }} }}"
+    )
+    try:
+        r = _session().post(f"{API}/graphql", headers=gh_headers(token),
+                            json={"query": query}, timeout=30)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+    body = r.json()
+    # Any error may have nulled an alias, which would read as "missing" and
+    # then be cached under the HEAD sha: let the REST path answer instead.
+    if body.get("errors"):
+        return None
+    node = (body.get("data") or {}).get("repository")
+    if node is None:
+        return None
+
+    files = {
+        f: (True, "present") if node.get(f"f{i}") else (False, "missing")
+        for i, f in enumerate(required_files)
+    }
+    tree = node.get("wf")
+    if tree is None:
+        return {"files": files, "workflows": ([], "error:404"), "texts": {}}
+    paths: List[str] = []
+    texts: Dict[str, str] = {}
+    for e in tree.get("entries") or []:
+        if e.get("type") != "blob":
+            continue
+        path = f".github/workflows/{e.get('name')}"
+        paths.append(path)
+        text = (e.get("object") or {}).get("text")
+        if text:
+            texts[path] = text
+    return {"files": files, "workflows": (paths, "ok"), "texts": texts}
+
+def get_head_sha(owner: str, repo: str, token: str) -> Optional[str]:
+    # The .sha media type returns just the commit id of the default branch HEAD.
+    headers = dict(gh_headers(token), Accept="application/vnd.github.sha")
+    try:
+        r = _session().get(f"{API}/repos/{owner}/{repo}/commits/HEAD",
+                           headers=headers, timeout=30)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+    return r.text.strip() or None
+
+def _cache_path(full: str, sha: str, what: str) -> Path:
+    key = hashlib.sha1(f"{full}@{sha}:{what}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+def cached_call(full: str, sha: Optional[str], what: str, fn: Callable[[], Any],
+                keep: Callable[[Any], bool] = lambda v: v is not None) -> Any:
+    """
+    Return fn() memoized on disk under (full, sha, what). Without a sha the
+    call is made uncached; results failing `keep` (e.g. transient errors)
+    are returned but not stored.
+    """
+    if sha is None:
+        return fn()
+    path = _cache_path(full, sha, what)
+    try:
+        value = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    else:
+        os.utime(path)
+        return value
+    value = fn()
+    if keep(value):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(value), encoding="utf-8")
+        os.replace(tmp, path)
+    return value
+
+def evict_cache() -> None:
+    try:
+        entries = [e for e in os.scandir(CACHE_DIR) if e.name.endswith((".json", ".body"))]
+    except FileNotFoundError:
+        return
+    stats = [(e.stat(), e.path) for e in entries]
+    total = sum(st.st_size for st, _ in stats)
+    if total <= CACHE_MAX_BYTES:
+        return
+    stats.sort(key=lambda x: x[0].st_mtime_ns)
+    for st, path in stats:
+        if total <= CACHE_MAX_BYTES:
+            break
+        os.remove(path)
+        total -= st.st_size
+
+def _definite(result: Any) -> bool:
+    # 200/404 answers are fixed for a given sha; other statuses may be transient.
+    msg = result[1]
+    return msg in ("present", "missing", "ok", "error:404")
 
 def list_secret_names(owner: str, repo: str, token: str) -> Tuple[List[str], str]:
     # Requires repo admin + actions:read for secrets listing.
     url = f"{API}/repos/{owner}/{repo}/actions/secrets"
-    r = api_get(url, token)
-    if r.status_code == 200:
-        names = [s.get("name") for s in (r.json().get("secrets") or [])]
+    status, data = api_get(url, token)
+    if status in API_OK:
+        names = [s.get("name") for s in ((data or {}).get("secrets") or [])]
         return names, "ok"
     # if not permitted, mark unknown
-    return [], f"unknown:{r.status_code}"
+    return [], f"unknown:{status}"
+
+def probe_repo(t: Dict[str, Any], cfg: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """
+    The cheap per-repo inputs fetched before any checks run: HEAD sha and,
+    if configured, the secret names (which change without a commit).
+    """
+    owner, repo = t["repo"].split("/", 1)
+    probe: Dict[str, Any] = {"sha": get_head_sha(owner, repo, token)}
+    if (cfg.get("optional_checks") or {}).get("check_repo_secrets_names"):
+        probe["secrets"] = list_secret_names(owner, repo, token)
+    return probe
+
+def scan_repo(
+    t: Dict[str, Any], cfg: Dict[str, Any], token: str, probe: Dict[str, Any]
+) -> Dict[str, Any]:
+    required_files = cfg.get("required_files") or []
+    required_wfs = cfg.get("required_workflows") or []
+    opts = cfg.get("optional_checks") or {}
+
+    full = t["repo"]
+    owner, repo = full.split("/", 1)
+
+    repo_entry = {
+        "repo": full,
+        "status": "unknown",
+        "required_files": {},
+        "required_workflows": {},
+        "optional": {},
+        "notes": []
+    }
+
+    # Files + workflow listing (+ texts) in one GraphQL query; per-file
+    # REST calls only if that query fails.
+    want_texts = bool(opts.get("ensure_workflow_dispatch"))
+    sha = probe["sha"]
+    aligned = cached_call(
+        full, sha, json.dumps(["alignment", required_files, want_texts]),
+        lambda: fetch_repo_alignment(owner, repo, required_files, want_texts, token),
+    )
+
+    # ---- required files
+    file_ok = True
+    for f in required_files:
+        if aligned is not None:
+            ok, msg = aligned["files"][f]
+        else:
+            ok, msg = cached_call(full, sha, f"exists:{f}",
+                                  lambda: file_exists(owner, repo, f, token), _definite)
+        repo_entry["required_files"][f] = {"ok": ok, "msg": msg}
+        if not ok:
+            file_ok = False
+
+    # ---- required workflows (by file path existence)
+    wf_ok = True
+    if aligned is not None:
+        wf_paths, wf_msg = aligned["workflows"]
+    else:
+        wf_paths, wf_msg = cached_call(full, sha, "workflows",
+                                       lambda: list_workflows(owner, repo, token), _definite)
+    if wf_msg != "ok":
+        wf_ok = False
+        repo_entry["notes"].append(f"workflow_list:{wf_msg}")
+    # Only a handful of required workflows: scanning the list beats
+    # building a set per repo; hash it once there are more lookups.
+    wf_lookup = set(wf_paths) if len(required_wfs) > 4 else wf_paths
+    for w in required_wfs:
+        ok = w in wf_lookup
+        repo_entry["required_workflows"][w] = {"ok": ok, "msg": "present" if ok else "missing"}
+        if not ok:
+            wf_ok = False
+
+    # ---- optional: ensure workflow_dispatch
+    if opts.get("ensure_workflow_dispatch"):
+        if aligned is not None:
+            texts = [(aligned["texts"].get(w, ""), "ok") for w in wf_paths]
+        else:
+            # REST fallback costs a contents call + raw download per workflow;
+            # overlap them instead of paying each round trip in turn.
+            def fetch_text(w: str) -> Tuple[str, str]:
+                return cached_call(full, sha, f"text:{w}",
+                                   lambda: fetch_file_text(owner, repo, w, token),
+                                   _definite)
+            if len(wf_paths) > 1:
+                with ThreadPoolExecutor(max_workers=MAX_TEXT_WORKERS) as ex:
+                    texts = list(ex.map(fetch_text, wf_paths))
+            else:
+                texts = [fetch_text(w) for w in wf_paths]
+        dispatch_fail = []
+        for w, (text, tmsg) in zip(wf_paths, texts):
+            if tmsg == "ok" and text:
+                found = scan_workflow_tokens(text)
+                if not found["dispatch"]:
+                    dispatch_fail.append(w)
+        repo_entry["optional"]["workflow_dispatch_missing_in"] = dispatch_fail
+
+    # ---- optional: secrets presence (names only)
+    check_names = opts.get("check_repo_secrets_names") or []
+    if check_names:
+        names, smsg = probe.get("secrets") or list_secret_names(owner, repo, token)
+        if smsg.startswith("unknown"):
+            repo_entry["optional"]["secrets_status"] = smsg
+            repo_entry["optional"]["secrets_missing"] = []
+        else:
+            missing = [n for n in check_names if n not in names]
+            repo_entry["optional"]["secrets_status"] = "ok"
+            repo_entry["optional"]["secrets_missing"] = missing
+
+    # ---- status decision
+    repo_entry["status"] = "pass" if file_ok and wf_ok else "fail"
+    return repo_entry
+
+def input_sha(targets: List[Dict[str, Any]], probes: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Hash of the config plus every target's probe, or None if a HEAD lookup
+    failed (results could then differ for the same recorded inputs).
+    """
+    if not all(p["sha"] for p in probes):
+        return None
+    h = hashlib.sha256(CFG_PATH.read_bytes())
+    for t, p in zip(targets, probes):
+        h.update(f"\n{t['repo']}:".encode("utf-8"))
+        h.update(json.dumps(p, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
 
 def main():
     token = os.getenv("PAT_WORKFLOW") or os.getenv("GH_STEGVERSE_PAT") or os.getenv("GITHUB_TOKEN")
@@ -104,9 +466,6 @@ def main():
 
     cfg = load_cfg()
     targets = cfg.get("targets") or []
-    required_files = cfg.get("required_files") or []
-    required_wfs = cfg.get("required_workflows") or []
-    opts = cfg.get("optional_checks") or {}
 
     results = []
     summary = {
@@ -118,136 +477,102 @@ def main():
         "rid": os.getenv("GITHUB_RUN_ID", "local"),
     }
 
-    for t in targets:
-        full = t["repo"]
-        owner, repo = full.split("/", 1)
-
-        repo_entry = {
-            "repo": full,
-            "status": "unknown",
-            "required_files": {},
-            "required_workflows": {},
-            "optional": {},
-            "notes": []
-        }
-
-        # ---- required files
-        file_ok = True
-        for f in required_files:
-            ok, msg = file_exists(owner, repo, f, token)
-            repo_entry["required_files"][f] = {"ok": ok, "msg": msg}
-            if not ok:
-                file_ok = False
-
-        # ---- required workflows (by file path existence)
-        wf_ok = True
-        wf_paths, wf_msg = list_workflows(owner, repo, token)
-        if wf_msg != "ok":
-            wf_ok = False
-            repo_entry["notes"].append(f"workflow_list:{wf_msg}")
-        wf_set = set(wf_paths)
-        for w in required_wfs:
-            ok = w in wf_set
-            repo_entry["required_workflows"][w] = {"ok": ok, "msg": "present" if ok else "missing"}
-            if not ok:
-                wf_ok = False
-
-        # ---- optional: ensure workflow_dispatch
-        if opts.get("ensure_workflow_dispatch"):
-            dispatch_fail = []
-            for w in wf_paths:
-                text, tmsg = fetch_file_text(owner, repo, w, token)
-                if tmsg == "ok" and text:
-                    if not has_workflow_dispatch(text):
-                        dispatch_fail.append(w)
-            repo_entry["optional"]["workflow_dispatch_missing_in"] = dispatch_fail
-
-        # ---- optional: secrets presence (names only)
-        check_names = opts.get("check_repo_secrets_names") or []
-        if check_names:
-            names, smsg = list_secret_names(owner, repo, token)
-            if smsg.startswith("unknown"):
-                repo_entry["optional"]["secrets_status"] = smsg
-                repo_entry["optional"]["secrets_missing"] = []
-            else:
-                missing = [n for n in check_names if n not in names]
-                repo_entry["optional"]["secrets_status"] = "ok"
-                repo_entry["optional"]["secrets_missing"] = missing
+    out_json = OUT_DIR / "repo_alignment_latest.json"
+    out_md = OUT_DIR / "repo_alignment_latest.md"
 
-        # ---- status decision
-        if file_ok and wf_ok:
-            repo_entry["status"] = "pass"
+    # Repos are independent and the work is all waiting on api.github.com;
+    # map() keeps target order for the reports. Probes come first: if
+    # neither they nor the config changed, the last reports still hold.
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_REPO_WORKERS, len(targets)))) as ex:
+        probes = list(ex.map(lambda t: probe_repo(t, cfg, token), targets))
+        in_sha = input_sha(targets, probes)
+        if in_sha is not None and out_json.exists() and read_input_marker(out_md) == in_sha:
+            print("✅ Repo alignment reports up-to-date (same config and repo state).")
+            return 0
+        results = list(ex.map(lambda tp: scan_repo(tp[0], cfg, token, tp[1]),
+                              zip(targets, probes)))
+    if targets:
+        save_etags()
+        evict_cache()
+    for repo_entry in results:
+        if repo_entry["status"] == "pass":
             summary["repos_pass"] += 1
         else:
-            repo_entry["status"] = "fail"
             summary["repos_fail"] += 1
 
-        results.append(repo_entry)
-
     # write JSON
-    out_json = OUT_DIR / "repo_alignment_latest.json"
     payload = {"summary": summary, "results": results}
-    out_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-    # write MD
-    lines = [
-        "# StegVerse Repo Alignment Report",
-        "",
-        f"- Run: {summary['ts_utc']}",
-        f"- RID: `{summary['rid']}`",
-        "",
-        "## Summary",
-        f"- Total repos: **{summary['repos_total']}**",
-        f"- Pass: **{summary['repos_pass']}**",
-        f"- Fail: **{summary['repos_fail']}**",
-        "",
-        "## Per-repo results",
-        ""
-    ]
-
-    for r in results:
-        badge = "✅" if r["status"] == "pass" else "❌"
-        lines.append(f"### {badge} {r['repo']}")
-        lines.append("")
-        lines.append("**Required files:**")
-        for f, st in r["required_files"].items():
-            fb = "✅" if st["ok"] else "❌"
-            lines.append(f"- {fb} `{f}` — {st['msg']}")
-        lines.append("")
-        lines.append("**Required workflows:**")
-        for w, st in r["required_workflows"].items():
-            wb = "✅" if st["ok"] else "❌"
-            lines.append(f"- {wb} `{w}` — {st['msg']}")
-        lines.append("")
-
-        opt = r.get("optional") or {}
-        if "workflow_dispatch_missing_in" in opt:
-            miss = opt["workflow_dispatch_missing_in"]
-            if miss:
-                lines.append("**Optional:** workflow_dispatch missing in:")
-                for m in miss:
-                    lines.append(f"- ⚠️ `{m}`")
-            else:
-                lines.append("**Optional:** workflow_dispatch present in all workflows.")
-            lines.append("")
-
-        if "secrets_status" in opt:
-            lines.append(f"**Optional secrets check:** {opt['secrets_status']}")
-            if opt.get("secrets_missing"):
-                for n in opt["secrets_missing"]:
-                    lines.append(f"- ❌ missing secret name `{n}`")
-            elif opt["secrets_status"] == "ok":
-                lines.append("- ✅ all required secret names present")
-            lines.append("")
-
-        if r["notes"]:
-            lines.append("**Notes:**")
-            for n in r["notes"]:
-                lines.append(f"- {n}")
-            lines.append("")
-
-    out_md = OUT_DIR / "repo_alignment_latest.md"
-    out_md.write_text("\n".join(lines), encoding="utf-8")
+    if orjson is not None:
+        out_json.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        out_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    # write MD: encoded straight into the buffered file, never held whole.
+    # Lines are newline-separated, not terminated, so the separator goes
+    # before every line but the first.
+    with out_md.open("wb") as fh:
+        first = True
+
+        def line(text: str = "") -> None:
+            nonlocal first
+            fh.write(text.encode("utf-8") if first else b"\n" + text.encode("utf-8"))
+            first = False
+
+        if in_sha is not None:
+            fh.write(INPUT_MARKER.format(in_sha).encode("utf-8"))
+        line("# StegVerse Repo Alignment Report")
+        line()
+        line(f"- Run: {summary['ts_utc']}")
+        line(f"- RID: `{summary['rid']}`")
+        line()
+        line("## Summary")
+        line(f"- Total repos: **{summary['repos_total']}**")
+        line(f"- Pass: **{summary['repos_pass']}**")
+        line(f"- Fail: **{summary['repos_fail']}**")
+        line()
+        line("## Per-repo results")
+        line()
+
+        for r in results:
+            badge = "✅" if r["status"] == "pass" else "❌"
+            line(f"### {badge} {r['repo']}")
+            line()
+            line("**Required files:**")
+            for f, st in r["required_files"].items():
+                fb = "✅" if st["ok"] else "❌"
+                line(f"- {fb} `{f}` — {st['msg']}")
+            line()
+            line("**Required workflows:**")
+            for w, st in r["required_workflows"].items():
+                wb = "✅" if st["ok"] else "❌"
+                line(f"- {wb} `{w}` — {st['msg']}")
+            line()
+
+            opt = r.get("optional") or {}
+            if "workflow_dispatch_missing_in" in opt:
+                miss = opt["workflow_dispatch_missing_in"]
+                if miss:
+                    line("**Optional:** workflow_dispatch missing in:")
+                    for m in miss:
+                        line(f"- ⚠️ `{m}`")
+                else:
+                    line("**Optional:** workflow_dispatch present in all workflows.")
+                line()
+
+            if "secrets_status" in opt:
+                line(f"**Optional secrets check:** {opt['secrets_status']}")
+                if opt.get("secrets_missing"):
+                    for n in opt["secrets_missing"]:
+                        line(f"- ❌ missing secret name `{n}`")
+                elif opt["secrets_status"] == "ok":
+                    line("- ✅ all required secret names present")
+                line()
+
+            if r["notes"]:
+                line("**Notes:**")
+                for n in r["notes"]:
+                    line(f"- {n}")
+                line()
 
     print(json.dumps(summary, indent=2))
     return 0
@@ -26,12 +26,22 @@ Safety:
 
 from __future__ import annotations
 
-import json, os, time, shutil, subprocess
+import json, os, time, shutil, subprocess, threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Set, Tuple, Optional
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from genesis_common import _SafeLoader, load_json_sibling
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[2]  # .../StegVerse-SCW
 CFG_PATH = ROOT / "docs/governance/repo_alignment_expectations.yaml"
@@ -44,28 +54,71 @@ API = "https://api.github.com"
 WORKDIR = ROOT / "work" / "alignment_fixer"
 WORKDIR.mkdir(parents=True, exist_ok=True)
 
+MAX_REPO_WORKERS = 8
+
 # How many times to retry the SAME missing-path fix before giving up.
 MAX_RETRIES_PER_ITEM = 2
 
-def sh(cmd: List[str], cwd: Optional[Path]=None, check: bool=True) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, cwd=str(cwd) if cwd else None, text=True, capture_output=True, check=check)
+# Written when no canonical copy of a required file / workflow is found.
+FILE_PLACEHOLDER = """# AUTOGENERATED PLACEHOLDER
+# Repo Alignment Fixer could not locate a canonical source for:
+#   {path}
+# Please replace with correct canonical file (prefer {tvc_repo}).
+"""
+
+WORKFLOW_PLACEHOLDER = """name: Placeholder Workflow ({wf})
+
+on:
+  workflow_dispatch: {{}}
+
+permissions:
+  contents: read
+
+jobs:
+  placeholder:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo "Placeholder created by Repo Alignment Fixer. Replace with canonical workflow."
+"""
+
+def sh(cmd: List[str], cwd: Optional[Path]=None, check: bool=True,
+       capture: bool=True) -> subprocess.CompletedProcess:
+    # capture=False: stdout goes to /dev/null (clone/push progress is never
+    # read); stderr is still kept for error messages.
+    if capture:
+        return subprocess.run(cmd, cwd=str(cwd) if cwd else None, text=True,
+                              capture_output=True, check=check)
+    return subprocess.run(cmd, cwd=str(cwd) if cwd else None, text=True,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=check)
+
+def sh_error(e: subprocess.CalledProcessError) -> str:
+    return (e.stderr or "").strip() or (e.stdout or "").strip()
 
 def load_yaml(p: Path) -> Dict[str, Any]:
     if not p.exists():
         return {}
-    return yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    raw = p.read_bytes()
+    data = load_json_sibling(p, raw)
+    if data is not None:
+        return data
+    return yaml.load(raw, Loader=_SafeLoader) or {}
 
 def load_json(p: Path) -> Dict[str, Any]:
     if not p.exists():
         return {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        # Bytes straight to the parser: no separate UTF-8 decode pass.
+        raw = p.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return {}
 
 def save_json(p: Path, data: Dict[str, Any]) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if orjson is not None:
+        p.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        p.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 def gh_headers(token: str) -> Dict[str, str]:
     return {
@@ -75,11 +128,34 @@ def gh_headers(token: str) -> Dict[str, str]:
         "User-Agent": "StegVerse-Repo-Alignment-Fixer"
     }
 
+_local = threading.local()
+
+def _session() -> requests.Session:
+    # One keep-alive session per worker thread; transient gateway errors and
+    # rate limiting are retried with backoff by the adapter.
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        sess = _local.session = requests.Session()
+        sess.mount("https://", HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5, raise_on_status=False,
+                              status_forcelist=[429, 502, 503, 504])))
+    return sess
+
 def api_get(url: str, token: str) -> requests.Response:
-    return requests.get(url, headers=gh_headers(token), timeout=30)
+    return _session().get(url, headers=gh_headers(token), timeout=30)
 
 def fetch_raw_from_repo(owner: str, repo: str, path: str, token: str) -> Tuple[str, str]:
     url = f"{API}/repos/{owner}/{repo}/contents/{path}"
+    # Raw media type: the file body comes back directly, no download_url hop.
+    headers = dict(gh_headers(token), Accept="application/vnd.github.raw")
+    r = _session().get(url, headers=headers, timeout=30)
+    if r.status_code == 200:
+        r.encoding = r.encoding or "utf-8"  # no charset on this media type
+        return r.text, "ok"
+    if r.status_code != 415:
+        return "", f"error:{r.status_code}"
+
+    # Media type refused: JSON metadata, then the download_url.
     r = api_get(url, token)
     if r.status_code != 200:
         return "", f"error:{r.status_code}"
@@ -87,11 +163,87 @@ def fetch_raw_from_repo(owner: str, repo: str, path: str, token: str) -> Tuple[s
     dl = data.get("download_url")
     if not dl:
         return "", "no_download_url"
-    raw = requests.get(dl, timeout=30)
+    raw = _session().get(dl, timeout=30)
     if raw.status_code != 200:
         return "", f"raw_error:{raw.status_code}"
     return raw.text, "ok"
 
+def remote_tree_paths(repo_full: str, token: str) -> Optional[Set[str]]:
+    """
+    Every path on the repo's HEAD from one recursive Git Trees call, or None
+    if that failed or GitHub truncated the listing (callers then clone).
+    """
+    r = api_get(f"{API}/repos/{repo_full}/git/trees/HEAD?recursive=1", token)
+    if r.status_code != 200:
+        return None
+    data = r.json()
+    if data.get("truncated"):
+        return None
+    return {e.get("path") for e in data.get("tree") or []}
+
+# Source-of-truth files are the same for every target repo: fetch each once.
+_TVC_CACHE: Dict[Tuple[str, str, str], Tuple[str, str]] = {}
+_tvc_lock = threading.Lock()
+
+def fetch_tvc_cached(owner: str, repo: str, path: str, token: str) -> Tuple[str, str]:
+    key = (owner, repo, path)
+    with _tvc_lock:
+        hit = _TVC_CACHE.get(key)
+    if hit is None:
+        hit = fetch_raw_from_repo(owner, repo, path, token)
+        with _tvc_lock:
+            hit = _TVC_CACHE.setdefault(key, hit)
+    return hit
+
+def graphql_fetch_files(
+    owner: str, repo: str, paths: List[str], token: str
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Text of every path on HEAD in one GraphQL query: {path: text}, with None
+    for paths that don't exist. Paths without complete text (binary,
+    truncated, directories) are left out, as are paths a null could mean an
+    error for (any `errors` in the response); everything if the query fails.
+    """
+    fields = " ".join(
+        f"f{i}: object(expression: {json.dumps('HEAD:' + p)}) "
+        f"{{ ... on Blob {{ text isTruncated }} }}"
+        for i, p in enumerate(paths)
+    )
+    query = (
+        f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+        f"{{ {fields} }} }}"
+    )
+    try:
+        r = _session().post(f"{API}/graphql", headers=gh_headers(token),
+                            json={"query": query}, timeout=30)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+    body = r.json()
+    node = (body.get("data") or {}).get("repository")
+    if node is None:
+        return None
+    # With errors present a null alias may be a failed lookup, not a missing
+    # file: only trust nulls from an error-free response.
+    nulls_mean_missing = not body.get("errors")
+    out: Dict[str, Optional[str]] = {}
+    for i, p in enumerate(paths):
+        obj = node.get(f"f{i}")
+        if obj is None:
+            if nulls_mean_missing:
+                out[p] = None
+        elif obj.get("text") is not None and not obj.get("isTruncated"):
+            out[p] = obj["text"]
+    return out
+
+def warm_tvc_cache(owner: str, repo: str, paths: List[str], token: str) -> None:
+    # One GraphQL round trip fills what it can; fetch_tvc_cached covers the rest.
+    texts = graphql_fetch_files(owner, repo, paths, token) or {}
+    with _tvc_lock:
+        for p, text in texts.items():
+            _TVC_CACHE[(owner, repo, p)] = (text, "ok") if text is not None else ("", "error:404")
+
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
@@ -102,31 +254,57 @@ def write_text(p: Path, txt: str):
 def history_key(repo_full: str, path: str) -> str:
     return f"{repo_full}::{path}"
 
-def should_skip_item(hist: Dict[str, Any], repo_full: str, path: str) -> bool:
-    key = history_key(repo_full, path)
+# Both take the history_key() for the item; callers build it once per path.
+def should_skip_item(hist: Dict[str, Any], key: str) -> bool:
     entry = hist.get(key) or {}
     fails = int(entry.get("fails", 0))
     return fails >= MAX_RETRIES_PER_ITEM
 
-def mark_item(hist: Dict[str, Any], repo_full: str, path: str, ok: bool, msg: str):
-    key = history_key(repo_full, path)
+def mark_item(hist: Dict[str, Any], key: str, ok: bool, msg: str, ts: str):
     entry = hist.get(key) or {"fails": 0, "last_msg": ""}
     if ok:
         entry["fails"] = 0
     else:
         entry["fails"] = int(entry.get("fails", 0)) + 1
     entry["last_msg"] = msg
-    entry["last_ts"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    entry["last_ts"] = ts
     hist[key] = entry
 
-def clone_repo(repo_full: str, dest: Path) -> Tuple[bool, str]:
+def sparse_clone_repo(repo_full: str, dest: Path, paths: List[str]) -> bool:
+    """
+    Partial clone that only downloads the blobs for `paths`: no blobs at
+    clone time, then a sparse checkout of exactly those paths. Anything
+    else in the repo is never fetched. False on any failure.
+    """
+    try:
+        sh(["gh", "repo", "clone", repo_full, str(dest), "--",
+            "--depth", "1", "--single-branch", "--no-tags",
+            "--filter=blob:none", "--no-checkout"], capture=False)
+        # Non-cone patterns so single files can be listed; anchored to the root.
+        sh(["git", "sparse-checkout", "set", "--no-cone", "--"]
+           + ["/" + p for p in paths], cwd=dest, capture=False)
+        sh(["git", "checkout"], cwd=dest, capture=False)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+def clone_repo(repo_full: str, dest: Path, paths: Optional[List[str]] = None) -> Tuple[bool, str]:
     if dest.exists():
         shutil.rmtree(dest)
+    if paths:
+        if sparse_clone_repo(repo_full, dest, paths):
+            return True, "cloned_sparse"
+        # Old git or a host without partial clone: plain shallow clone below.
+        if dest.exists():
+            shutil.rmtree(dest)
     try:
-        sh(["gh", "repo", "clone", repo_full, str(dest), "--", "--depth", "1"])
+        # Shallow, default branch only, no tags: only HEAD's tree is needed.
+        # Submodules are left out, as before; nothing here reads them.
+        sh(["gh", "repo", "clone", repo_full, str(dest), "--",
+            "--depth", "1", "--single-branch", "--no-tags"], capture=False)
         return True, "cloned"
     except subprocess.CalledProcessError as e:
-        return False, f"clone_failed: {e.stderr.strip() or e.stdout.strip()}"
+        return False, f"clone_failed: {sh_error(e)}"
 
 def git_commit_push(dest: Path, message: str) -> Tuple[bool, str]:
     try:
@@ -134,12 +312,138 @@ def git_commit_push(dest: Path, message: str) -> Tuple[bool, str]:
         sh(["git", "config", "user.email", "alignment-fixer@stegverse.local"], cwd=dest)
         if not sh(["git", "status", "--porcelain"], cwd=dest).stdout.strip():
             return True, "no_changes"
-        sh(["git", "add", "-A"], cwd=dest)
+        sh(["git", "add", "-A"], cwd=dest, capture=False)
         sh(["git", "commit", "-m", message], cwd=dest)
-        sh(["git", "push", "origin", "HEAD"], cwd=dest)
+        sh(["git", "push", "origin", "HEAD"], cwd=dest, capture=False)
         return True, "pushed"
     except subprocess.CalledProcessError as e:
-        return False, f"push_failed: {e.stderr.strip() or e.stdout.strip()}"
+        return False, f"push_failed: {sh_error(e)}"
+
+def reported_failing_paths(entry: Dict[str, Any], required: List[str]) -> Optional[List[str]]:
+    """
+    Required paths the alignment report did not find in this repo (paths it
+    has no check for count as failing), or None for a report without
+    per-path results.
+    """
+    if "required_files" not in entry and "required_workflows" not in entry:
+        return None
+    checks = {**(entry.get("required_files") or {}), **(entry.get("required_workflows") or {})}
+    return [p for p in required if not (checks.get(p) or {}).get("ok")]
+
+def fix_one_repo(
+    repo_full: str,
+    hist: Dict[str, Any],
+    token: str,
+    tvc_repo: str,
+    required_files: List[str],
+    required_workflows: List[str],
+    scw_texts: Dict[str, str],
+    ts: str,
+    failing_paths: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Any], str, Dict[str, Any]]:
+    """
+    Clone one failing repo, restore what it is missing and push.
+
+    Returns (attempt record, summary counter to bump, this repo's history
+    entries). `hist` is only read: the repo's entries are copied up front,
+    so workers never write shared state. `scw_texts` holds the SCW fallback
+    copies of required files, read once per run; `ts` is the run timestamp
+    for history entries; `failing_paths` is what the alignment report says
+    is missing (None if it doesn't say).
+    """
+    tvc_owner, tvc_name = tvc_repo.split("/", 1)
+    prefix = history_key(repo_full, "")
+    hist = {k: dict(v) for k, v in hist.items() if k.startswith(prefix)}
+
+    print(f"\n--- Fixing {repo_full} ---")
+
+    # Everything the report flagged is retry-capped: no API call, no clone.
+    if failing_paths is not None:
+        if all(should_skip_item(hist, prefix + p) for p in failing_paths):
+            notes = [f"skip:{p}:max_retries" for p in failing_paths]
+            return ({"repo": repo_full, "status": "nothing_to_fix", "notes": notes},
+                    "repos_skipped", hist)
+
+    # Nothing fixable missing on HEAD (per the tree listing): skip the clone.
+    present = remote_tree_paths(repo_full, token)
+    if present is not None:
+        needed = [p for p in required_files + required_workflows if p not in present]
+        if all(should_skip_item(hist, prefix + p) for p in needed):
+            notes = [f"skip:{p}:max_retries" for p in needed]
+            return ({"repo": repo_full, "status": "nothing_to_fix", "notes": notes},
+                    "repos_skipped", hist)
+
+    dest = WORKDIR / repo_full.replace("/", "__")
+    ok, msg = clone_repo(repo_full, dest, required_files + required_workflows)
+    if not ok:
+        return {"repo": repo_full, "status": "clone_failed", "message": msg}, "repos_failed", hist
+
+    changed_any = False
+    repo_notes = []
+
+    # Required files
+    for path in required_files:
+        abs_path = dest / path
+        if abs_path.exists():
+            continue
+        key = prefix + path
+        if should_skip_item(hist, key):
+            repo_notes.append(f"skip:{path}:max_retries")
+            continue
+
+        txt, st = fetch_tvc_cached(tvc_owner, tvc_name, path, token)
+        if st == "ok" and txt.strip():
+            write_text(abs_path, txt)
+            changed_any = True
+            mark_item(hist, key, True, "restored_from_TVC", ts)
+            repo_notes.append(f"fixed:{path}:from_TVC")
+            continue
+
+        if path in scw_texts:
+            write_text(abs_path, scw_texts[path])
+            changed_any = True
+            mark_item(hist, key, True, "restored_from_SCW", ts)
+            repo_notes.append(f"fixed:{path}:from_SCW")
+            continue
+
+        placeholder = FILE_PLACEHOLDER.format(path=path, tvc_repo=tvc_repo)
+        write_text(abs_path, placeholder)
+        changed_any = True
+        mark_item(hist, key, False, "placeholder_created", ts)
+        repo_notes.append(f"fixed:{path}:placeholder")
+
+    # Required workflows
+    for wf in required_workflows:
+        abs_wf = dest / wf
+        if abs_wf.exists():
+            continue
+        key = prefix + wf
+        if should_skip_item(hist, key):
+            repo_notes.append(f"skip:{wf}:max_retries")
+            continue
+
+        txt, st = fetch_tvc_cached(tvc_owner, tvc_name, wf, token)
+        if st == "ok" and txt.strip():
+            write_text(abs_wf, txt)
+            changed_any = True
+            mark_item(hist, key, True, "workflow_from_TVC", ts)
+            repo_notes.append(f"fixed:{wf}:from_TVC")
+        else:
+            placeholder = WORKFLOW_PLACEHOLDER.format(wf=wf)
+            write_text(abs_wf, placeholder)
+            changed_any = True
+            mark_item(hist, key, False, "workflow_placeholder_created", ts)
+            repo_notes.append(f"fixed:{wf}:placeholder")
+
+    if changed_any:
+        ok2, msg2 = git_commit_push(dest, "Alignment Fixer: restore required StegVerse files/workflows")
+        if ok2:
+            return ({"repo": repo_full, "status": "fixed", "message": msg2, "notes": repo_notes},
+                    "repos_fixed", hist)
+        return ({"repo": repo_full, "status": "push_failed", "message": msg2, "notes": repo_notes},
+                "repos_failed", hist)
+    return ({"repo": repo_full, "status": "nothing_to_fix", "notes": repo_notes},
+            "repos_skipped", hist)
 
 def main() -> int:
     print("=== Repo Alignment Fixer (ASL-2) ===")
@@ -166,10 +470,11 @@ def main() -> int:
     hist = load_json(HIST_PATH) or {}
 
     tvc_repo = cfg.get("source_of_truth_repo") or "StegVerse-Labs/TVC"
-    tvc_owner, tvc_name = tvc_repo.split("/", 1)
 
+    # One timestamp for the whole run: the report and every history entry.
+    run_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     fixer_results = {
-        "ts_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "ts_utc": run_ts,
         "rid": os.getenv("GITHUB_RUN_ID", "local"),
         "attempted": [],
         "summary": {"repos_fixed": 0, "repos_skipped": 0, "repos_failed": 0}
@@ -177,105 +482,36 @@ def main() -> int:
 
     align_map = {r["repo"]: r for r in (alignment.get("results") or [])}
 
-    for t in targets:
-        repo_full = t["repo"]
-        ar = align_map.get(repo_full)
-        if not ar or ar.get("status") != "fail":
-            continue
-
-        print(f"\n--- Fixing {repo_full} ---")
-
-        dest = WORKDIR / repo_full.replace("/", "__")
-        ok, msg = clone_repo(repo_full, dest)
-        if not ok:
-            fixer_results["attempted"].append({"repo": repo_full, "status": "clone_failed", "message": msg})
-            fixer_results["summary"]["repos_failed"] += 1
-            continue
-
-        changed_any = False
-        repo_notes = []
-
-        # Required files
-        for path in required_files:
-            abs_path = dest / path
-            if abs_path.exists():
-                continue
-            if should_skip_item(hist, repo_full, path):
-                repo_notes.append(f"skip:{path}:max_retries")
-                continue
-
-            txt, st = fetch_raw_from_repo(tvc_owner, tvc_name, path, token)
-            if st == "ok" and txt.strip():
-                write_text(abs_path, txt)
-                changed_any = True
-                mark_item(hist, repo_full, path, True, "restored_from_TVC")
-                repo_notes.append(f"fixed:{path}:from_TVC")
-                continue
-
-            scw_src = ROOT / path
-            if scw_src.exists():
-                write_text(abs_path, scw_src.read_text(encoding="utf-8"))
-                changed_any = True
-                mark_item(hist, repo_full, path, True, "restored_from_SCW")
-                repo_notes.append(f"fixed:{path}:from_SCW")
-                continue
-
-            placeholder = f"""# AUTOGENERATED PLACEHOLDER
-# Repo Alignment Fixer could not locate a canonical source for:
-#   {path}
-# Please replace with correct canonical file (prefer {tvc_repo}).
-"""
-            write_text(abs_path, placeholder)
-            changed_any = True
-            mark_item(hist, repo_full, path, False, "placeholder_created")
-            repo_notes.append(f"fixed:{path}:placeholder")
-
-        # Required workflows
-        for wf in required_workflows:
-            abs_wf = dest / wf
-            if abs_wf.exists():
-                continue
-            if should_skip_item(hist, repo_full, wf):
-                repo_notes.append(f"skip:{wf}:max_retries")
-                continue
-
-            txt, st = fetch_raw_from_repo(tvc_owner, tvc_name, wf, token)
-            if st == "ok" and txt.strip():
-                write_text(abs_wf, txt)
-                changed_any = True
-                mark_item(hist, repo_full, wf, True, "workflow_from_TVC")
-                repo_notes.append(f"fixed:{wf}:from_TVC")
-            else:
-                placeholder = f"""name: Placeholder Workflow ({wf})
-
-on:
-  workflow_dispatch: {{}}
-
-permissions:
-  contents: read
-
-jobs:
-  placeholder:
-    runs-on: ubuntu-latest
-    steps:
-      - run: echo "Placeholder created by Repo Alignment Fixer. Replace with canonical workflow."
-"""
-                write_text(abs_wf, placeholder)
-                changed_any = True
-                mark_item(hist, repo_full, wf, False, "workflow_placeholder_created")
-                repo_notes.append(f"fixed:{wf}:placeholder")
-
-        if changed_any:
-            ok2, msg2 = git_commit_push(dest, "Alignment Fixer: restore required StegVerse files/workflows")
-            if ok2:
-                fixer_results["summary"]["repos_fixed"] += 1
-                fixer_results["attempted"].append({"repo": repo_full, "status": "fixed", "message": msg2, "notes": repo_notes})
-            else:
-                fixer_results["summary"]["repos_failed"] += 1
-                fixer_results["attempted"].append({"repo": repo_full, "status": "push_failed", "message": msg2, "notes": repo_notes})
-        else:
-            fixer_results["summary"]["repos_skipped"] += 1
-            fixer_results["attempted"].append({"repo": repo_full, "status": "nothing_to_fix", "notes": repo_notes})
+    # Repos are independent and each fix is clone/API/push bound; map()
+    # keeps target order for the report. History is merged back here.
+    failing = [
+        t["repo"] for t in targets
+        if (align_map.get(t["repo"]) or {}).get("status") == "fail"
+    ]
+    if failing:
+        tvc_owner, tvc_name = tvc_repo.split("/", 1)
+        with ThreadPoolExecutor(max_workers=min(MAX_REPO_WORKERS, len(failing))) as ex:
+            # Warm the source-of-truth cache once: GraphQL for the lot, then
+            # concurrent REST for anything it could not answer.
+            wanted = list(dict.fromkeys(required_files + required_workflows))
+            warm_tvc_cache(tvc_owner, tvc_name, wanted, token)
+            list(ex.map(lambda p: fetch_tvc_cached(tvc_owner, tvc_name, p, token), wanted))
+            # SCW fallback copies are the same for every repo: read them once.
+            scw_texts = {
+                p: (ROOT / p).read_text(encoding="utf-8")
+                for p in required_files if (ROOT / p).exists()
+            }
+            required = required_files + required_workflows
+            outcomes = list(ex.map(
+                lambda r: fix_one_repo(r, hist, token, tvc_repo,
+                                       required_files, required_workflows, scw_texts,
+                                       run_ts, reported_failing_paths(align_map[r], required)),
+                failing,
+            ))
+        for attempt, counter, repo_hist in outcomes:
+            fixer_results["attempted"].append(attempt)
+            fixer_results["summary"][counter] += 1
+            hist.update(repo_hist)
 
     save_json(HIST_PATH, hist)
 
@@ -283,22 +519,20 @@ jobs:
     OUT_MD   = OUT_DIR / "repo_alignment_fixer_latest.md"
     save_json(OUT_JSON, fixer_results)
 
-    md_lines = [
-        "# StegVerse Repo Alignment Fixer Report",
-        "",
-        f"- Run: {fixer_results['ts_utc']}",
-        f"- RID: `{fixer_results['rid']}`",
-        "",
-        "## Summary",
-        *(f"- {k}: **{v}**" for k, v in fixer_results["summary"].items()),
-        "",
-        "## Attempts"
-    ]
-    for a in fixer_results["attempted"]:
-        md_lines.append(f"- **{a['repo']}** — {a['status']} — {a.get('message','')}")
-        for n in a.get("notes") or []:
-            md_lines.append(f"  - {n}")
-    write_text(OUT_MD, "\n".join(md_lines) + "\n")
+    ensure_dir(OUT_MD.parent)
+    with OUT_MD.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        w = f.write
+        w("# StegVerse Repo Alignment Fixer Report\n\n")
+        w(f"- Run: {fixer_results['ts_utc']}\n")
+        w(f"- RID: `{fixer_results['rid']}`\n\n")
+        w("## Summary\n")
+        for k, v in fixer_results["summary"].items():
+            w(f"- {k}: **{v}**\n")
+        w("\n## Attempts\n")
+        for a in fixer_results["attempted"]:
+            w(f"- **{a['repo']}** — {a['status']} — {a.get('message','')}\n")
+            for n in a.get("notes") or []:
+                w(f"  - {n}\n")
     return 0
 
 if __name__ == "__main__":
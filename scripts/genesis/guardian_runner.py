@@ -13,15 +13,23 @@ This is the orchestration layer for "guardian" style AI entities.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import sys
-import datetime as _dt
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml  # Requires PyYAML (already used elsewhere in SCW)
 
+from genesis_common import _SafeLoader, load_json_sibling
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Paths & helpers
@@ -34,16 +42,17 @@ REPORT_DIR = ROOT / "reports" / "guardians"
 
 
 def _now_iso() -> str:
-    return _dt.datetime.utcnow().isoformat() + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+@functools.lru_cache(maxsize=1)
 def _get_run_id() -> str:
     # Prefer the GitHub run ID if present so reports correlate with Actions
     rid = os.getenv("GITHUB_RUN_ID")
     if rid:
         return rid
     # Fallback: timestamp-based ID
-    return _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    return time.strftime("%Y%m%d%H%M%S", time.gmtime())
 
 
 # ---------------------------------------------------------------------------
@@ -71,11 +80,13 @@ def task_workflow_health(root: Path) -> Dict[str, Any]:
         result["details"] = {}
         return result
 
-    yml_files = list(workflows_dir.glob("*.yml"))
-    yaml_files = list(workflows_dir.glob("*.yaml"))
-    all_files = sorted(set(yml_files + yaml_files))
+    # One directory pass picks up both extensions; dirent types need no stat.
+    with os.scandir(workflows_dir) as it:
+        all_files = sorted(
+            e.name for e in it if e.name.endswith((".yml", ".yaml")) and e.is_file()
+        )
 
-    result["details"]["workflow_files"] = [p.name for p in all_files]
+    result["details"]["workflow_files"] = all_files
     result["details"]["count"] = len(all_files)
 
     if not all_files:
@@ -161,8 +172,11 @@ def load_registry(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise SystemExit(f"Guardian registry not found: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    # Prefer the JSON mirror; libyaml parses the raw bytes otherwise.
+    raw = path.read_bytes()
+    data = load_json_sibling(path, raw)
+    if data is None:
+        data = yaml.load(raw, Loader=_SafeLoader) or {}
 
     if "tasks" not in data or not isinstance(data["tasks"], list):
         raise SystemExit("guardian_registry.yaml is missing a 'tasks' list.")
@@ -174,6 +188,13 @@ def load_registry(path: Path) -> Dict[str, Any]:
 # Report writers
 # ---------------------------------------------------------------------------
 
+def _jdump(obj: Any) -> bytes:
+    """Indented, key-sorted JSON as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+
 def write_reports(
     run_id: str,
     generated_at: str,
@@ -186,36 +207,27 @@ def write_reports(
     md_path = REPORT_DIR / f"guardian_run_{run_id}.md"
     latest_json_path = REPORT_DIR / "guardian_run_latest.json"
 
-    lines: List[str] = []
-    lines.append("# StegVerse Guardian Run Report")
-    lines.append("")
-    lines.append(f"- Run ID: `{run_id}`")
-    lines.append(f"- Generated at: `{generated_at}`")
-    lines.append("")
-    lines.append("## Tasks")
-    lines.append("")
-
-    for r in task_results:
-        tid = r.get("id", "unknown")
-        status = r.get("status", "unknown")
-        summary = r.get("summary", "").strip() or "(no summary)"
-
-        lines.append(f"### `{tid}`")
-        lines.append(f"- Status: **{status}**")
-        lines.append(f"- Summary: {summary}")
-        details = r.get("details") or {}
-        if details:
-            lines.append("")
-            lines.append("<details><summary>Details</summary>")
-            lines.append("")
-            lines.append("```json")
-            lines.append(json.dumps(details, indent=2, sort_keys=True))
-            lines.append("```")
-            lines.append("</details>")
-        lines.append("")
-
-    with md_path.open("w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # Streamed straight to the file; each task block is preceded by a blank line.
+    with md_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        w = f.write
+        w("# StegVerse Guardian Run Report\n\n")
+        w(f"- Run ID: `{run_id}`\n")
+        w(f"- Generated at: `{generated_at}`\n\n")
+        w("## Tasks\n")
+
+        for r in task_results:
+            tid = r.get("id", "unknown")
+            status = r.get("status", "unknown")
+            summary = r.get("summary", "").strip() or "(no summary)"
+
+            w(f"\n### `{tid}`\n")
+            w(f"- Status: **{status}**\n")
+            w(f"- Summary: {summary}\n")
+            details = r.get("details") or {}
+            if details:
+                w("\n<details><summary>Details</summary>\n\n```json\n")
+                w(json.dumps(details, indent=2, sort_keys=True))
+                w("\n```\n</details>\n")
 
     # JSON summary (for future automation / guardian_actions)
     payload = {
@@ -224,8 +236,7 @@ def write_reports(
         "registry": registry,
         "tasks": task_results,
     }
-    with latest_json_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    latest_json_path.write_bytes(_jdump(payload))
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +23,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List
 
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[2]
 REPORT_DIR = ROOT / "reports" / "pat_audit"
 
@@ -65,7 +70,10 @@ def main() -> int:
         "missing_count": missing,
         "checks": [asdict(c) for c in checks],
     }
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
     lines = []
     lines.append("# StegVerse PAT Secrets Guardian Report")
@@ -28,22 +28,51 @@ from __future__ import annotations
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import yaml  # We already use PyYAML in SCW
 except Exception:
     yaml = None
 
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 
 ROOT = Path(__file__).resolve().parents[2]  # .../StegVerse-SCW
 REPORT_DIR = ROOT / "reports" / "guardians"
 LATEST_JSON = REPORT_DIR / "guardian_run_latest.json"
 ASL_CONFIG = ROOT / "docs" / "governance" / "automation_safety_levels.yaml"
 
+# Safety cap on README files generated per run.
+MAX_READMES_PER_RUN = 12
+# Concurrent GitHub Models calls; kept low to stay under per-minute limits.
+MAX_MODEL_WORKERS = 4
+
+# One keep-alive session for every GitHub Models call; rate limiting and
+# server errors are retried with backoff (Retry-After is honoured).
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST", "GET"],
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 # ---------------- ASL helpers ----------------
 
@@ -76,8 +105,8 @@ def is_asl_at_most(asl: str, limit: str) -> bool:
 def load_latest_run() -> Dict[str, Any]:
     if not LATEST_JSON.exists():
         raise SystemExit(f"Latest guardian JSON not found: {LATEST_JSON}")
-    with LATEST_JSON.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = LATEST_JSON.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def get_github_token() -> str:
@@ -105,7 +134,7 @@ def call_github_model(system_prompt: str, user_prompt: str, token: str) -> str:
         "X-GitHub-Api-Version": "2022-11-28",
     }
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=25)
+    resp = SESSION.post(url, headers=headers, json=payload, timeout=25)
     if resp.status_code >= 400:
         raise RuntimeError(
             f"GitHub Models error {resp.status_code}: {resp.text[:300]}"
@@ -117,6 +146,16 @@ def call_github_model(system_prompt: str, user_prompt: str, token: str) -> str:
         return json.dumps(data, indent=2)
 
 
+def try_github_model(
+    system_prompt: str, user_prompt: str, token: str
+) -> Tuple[Optional[str], Optional[Exception]]:
+    # (content, None) or (None, error), so one failed call doesn't stop the rest.
+    try:
+        return call_github_model(system_prompt, user_prompt, token), None
+    except Exception as e:
+        return None, e
+
+
 def list_folder_contents(folder: Path) -> List[str]:
     if not folder.exists():
         return []
@@ -213,46 +252,60 @@ def main() -> int:
     skipped_existing = 0
     skipped_missing_folder = 0
 
-    for rel in sorted(set(missing_dirs)):
-        folder = ROOT / rel
-        readme_path = folder / "README.md"
-
-        if not folder.exists():
-            print(f"- Skipping `{rel}` (folder does not exist on disk).")
-            skipped_missing_folder += 1
-            continue
-
-        if readme_path.exists():
-            print(f"- Skipping `{rel}` (README.md already exists).")
-            skipped_existing += 1
-            continue
-
-        # Safety: cap number of creations per run
-        if created >= 12:
-            print("Reached generation limit (12 README files). Stopping.")
-            break
-
-        print(f"- Generating README.md for `{rel}` ...")
-        files = list_folder_contents(folder)
-        user_prompt = build_user_prompt(rel, files)
-
-        try:
-            content = call_github_model(system_prompt, user_prompt, token)
-        except Exception as e:
-            print(f"  ❌ GitHub Models call failed for `{rel}`: {e}")
-            continue
-
-        banner = (
-            "<!-- AUTO-GENERATED by StegVerse Guardian Worker (ASL-1).\n"
-            "     Edit freely; this file is meant as a starting point.\n"
-            "     Regenerate via Guardians if needed. -->\n\n"
-        )
-        final_md = banner + content.strip() + "\n"
+    banner = (
+        "<!-- AUTO-GENERATED by StegVerse Guardian Worker (ASL-1).\n"
+        "     Edit freely; this file is meant as a starting point.\n"
+        "     Regenerate via Guardians if needed. -->\n\n"
+    )
 
-        folder.mkdir(parents=True, exist_ok=True)
-        readme_path.write_text(final_md, encoding="utf-8")
-        created += 1
-        print(f"  ✅ Wrote {readme_path.relative_to(ROOT)}")
+    # Model calls are pure network wait: run a few at once, in batches sized
+    # to the READMEs still allowed this run, so the cap counts files actually
+    # written and a failed call frees its slot for the next folder. map()
+    # keeps each batch in folder order; files are written on the main thread.
+    pending = iter(sorted(set(missing_dirs)))
+    with ThreadPoolExecutor(max_workers=MAX_MODEL_WORKERS) as ex:
+        while True:
+            items: List[Tuple[str, Path, str]] = []
+            for rel in pending:
+                folder = ROOT / rel
+                readme_path = folder / "README.md"
+
+                if not folder.exists():
+                    print(f"- Skipping `{rel}` (folder does not exist on disk).")
+                    skipped_missing_folder += 1
+                    continue
+
+                if readme_path.exists():
+                    print(f"- Skipping `{rel}` (README.md already exists).")
+                    skipped_existing += 1
+                    continue
+
+                print(f"- Generating README.md for `{rel}` ...")
+                files = list_folder_contents(folder)
+                items.append((rel, folder, build_user_prompt(rel, files)))
+                if len(items) >= MAX_READMES_PER_RUN - created:
+                    break
+            if not items:
+                break
+
+            results = ex.map(lambda it: try_github_model(system_prompt, it[2], token), items)
+            for (rel, folder, _), (content, err) in zip(items, results):
+                readme_path = folder / "README.md"
+                if err is not None:
+                    print(f"  ❌ GitHub Models call failed for `{rel}`: {err}")
+                    continue
+
+                final_md = banner + content.strip() + "\n"
+
+                folder.mkdir(parents=True, exist_ok=True)
+                readme_path.write_text(final_md, encoding="utf-8")
+                created += 1
+                print(f"  ✅ Wrote {readme_path.relative_to(ROOT)}")
+
+            # Safety: cap number of creations per run
+            if created >= MAX_READMES_PER_RUN:
+                print(f"Reached generation limit ({MAX_READMES_PER_RUN} README files). Stopping.")
+                break
 
     print("")
     print("Summary:")
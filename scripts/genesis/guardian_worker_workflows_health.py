@@ -17,17 +17,34 @@ it does not modify any workflows.
 from __future__ import annotations
 
 import datetime as _dt
-from dataclasses import dataclass, asdict
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 import yaml  # type: ignore
 
+from genesis_common import _SafeLoader, write_atomic
+
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 
 ROOT = Path(".")
 WORKFLOW_DIR = ROOT / ".github" / "workflows"
 REPORT_DIR = ROOT / "scripts" / "reports" / "guardians"
 
+# Gitignored; CI restores it with actions/cache rather than committing it.
+SCAN_CACHE_PATH = REPORT_DIR / ".cache" / "workflow_scan.json"
+
+# Below this many workflow files, process start-up costs more than it saves.
+PARALLEL_MIN_FILES = 16
+
 
 @dataclass
 class WorkflowIssue:
@@ -50,8 +67,64 @@ class WorkflowHealthSummary:
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # Binary mode: libyaml reads the raw bytes and detects the encoding itself.
+    with path.open("rb") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _parse_one(
+    path_str: str, rel: str
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse one workflow file. Returns (rel, data, error_detail); module-level
+    so it can run in a worker process.
+    """
+    try:
+        return rel, _load_yaml(Path(path_str)), None
+    except Exception as exc:  # noqa: BLE001
+        return rel, None, f"{type(exc).__name__}: {exc}"
+
+
+def _file_issues(
+    rel: str, data: Optional[Dict[str, Any]], error: Optional[str]
+) -> List[WorkflowIssue]:
+    if data is None:
+        return [WorkflowIssue(file=rel, kind="parse_error", detail=error or "")]
+
+    issues: List[WorkflowIssue] = []
+    # Basic shape checks
+    if "name" not in data:
+        issues.append(
+            WorkflowIssue(
+                file=rel,
+                kind="missing_name",
+                detail='Workflow file is missing top-level "name" key.',
+            )
+        )
+
+    if "on" not in data:
+        issues.append(
+            WorkflowIssue(
+                file=rel,
+                kind="missing_on",
+                detail='Workflow file is missing top-level "on" trigger block.',
+            )
+        )
+    return issues
+
+
+def _load_scan_cache() -> Dict[str, Any]:
+    try:
+        with SCAN_CACHE_PATH.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_scan_cache(cache: Dict[str, Any]) -> None:
+    SCAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(SCAN_CACHE_PATH, json.dumps(cache, sort_keys=True).encode("utf-8"))
 
 
 def scan_workflows() -> WorkflowHealthSummary:
@@ -59,46 +132,60 @@ def scan_workflows() -> WorkflowHealthSummary:
     if not WORKFLOW_DIR.exists():
         return summary
 
-    for wf_path in sorted(WORKFLOW_DIR.glob("*.yml")) + sorted(
-        WORKFLOW_DIR.glob("*.yaml")
-    ):
-        summary.files_scanned += 1
-        rel = wf_path.relative_to(ROOT).as_posix()
-
-        try:
-            data = _load_yaml(wf_path)
-        except Exception as exc:  # noqa: BLE001
-            summary.parse_errors += 1
-            summary.issues.append(
-                WorkflowIssue(
-                    file=rel,
-                    kind="parse_error",
-                    detail=f"{type(exc).__name__}: {exc}",
-                )
-            )
-            continue
-
-        # Basic shape checks
-        if "name" not in data:
-            summary.missing_name += 1
-            summary.issues.append(
-                WorkflowIssue(
-                    file=rel,
-                    kind="missing_name",
-                    detail='Workflow file is missing top-level "name" key.',
-                )
-            )
-
-        if "on" not in data:
-            summary.missing_on += 1
-            summary.issues.append(
-                WorkflowIssue(
-                    file=rel,
-                    kind="missing_on",
-                    detail='Workflow file is missing top-level "on" trigger block.',
-                )
-            )
+    # One directory pass; *.yml sort ahead of *.yaml, each group by name.
+    rel_dir = WORKFLOW_DIR.relative_to(ROOT).as_posix()
+    with os.scandir(WORKFLOW_DIR) as it:
+        names = [
+            e.name
+            for e in it
+            if e.name.endswith((".yml", ".yaml")) and e.is_file(follow_symlinks=False)
+        ]
+    names.sort(key=lambda n: (n.endswith(".yaml"), n))
+
+    # Files whose content hash matches the last scan reuse its issues; only
+    # the rest are parsed. Entries for deleted files simply aren't carried over.
+    old_cache = _load_scan_cache()
+    cache: Dict[str, Any] = {}
+    per_file: List[Optional[List[WorkflowIssue]]] = []
+    misses: List[Tuple[int, str, str]] = []
+    for name in names:
+        path_str = os.path.join(WORKFLOW_DIR, name)
+        rel = f"{rel_dir}/{name}"
+        with open(path_str, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        hit = old_cache.get(rel)
+        if hit and hit[0] == digest:
+            per_file.append([WorkflowIssue(rel, kind, detail) for kind, detail in hit[1]])
+            cache[rel] = hit
+        else:
+            misses.append((len(per_file), path_str, rel))
+            per_file.append(None)
+            cache[rel] = [digest, []]
+
+    miss_paths = [m[1] for m in misses]
+    miss_rels = [m[2] for m in misses]
+    if len(misses) < PARALLEL_MIN_FILES:
+        parsed = list(map(_parse_one, miss_paths, miss_rels))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            parsed = list(pool.map(_parse_one, miss_paths, miss_rels, chunksize=8))
+    for (idx, _, _), result in zip(misses, parsed):
+        issues = per_file[idx] = _file_issues(*result)
+        cache[result[0]][1] = [[i.kind, i.detail] for i in issues]
 
+    for issues in per_file:
+        summary.files_scanned += 1
+        for issue in issues or ():
+            if issue.kind == "parse_error":
+                summary.parse_errors += 1
+            elif issue.kind == "missing_name":
+                summary.missing_name += 1
+            elif issue.kind == "missing_on":
+                summary.missing_on += 1
+            summary.issues.append(issue)
+
+    if cache != old_cache:
+        _save_scan_cache(cache)
     return summary
 
 
@@ -106,68 +193,86 @@ def _ensure_report_dir() -> None:
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _format_markdown(summary: WorkflowHealthSummary, run_id: str) -> str:
-    now = _dt.datetime.utcnow().isoformat() + "Z"
-    lines: List[str] = []
+_REPORT_TEMPLATE = """\
+# StegVerse Workflow Health Report
+
+- Generated at: `{generated_at}`
+- Run ID: `{run_id}`
+
+## Summary
+
+- Workflow files scanned: **{files_scanned}**
+- YAML parse errors: **{parse_errors}**
+- Missing `name`: **{missing_name}**
+- Missing `on`: **{missing_on}**
 
-    lines.append("# StegVerse Workflow Health Report")
-    lines.append("")
-    lines.append(f"- Generated at: `{now}`")
-    lines.append(f"- Run ID: `{run_id}`")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- Workflow files scanned: **{summary.files_scanned}**")
-    lines.append(f"- YAML parse errors: **{summary.parse_errors}**")
-    lines.append(f"- Missing `name`: **{summary.missing_name}**")
-    lines.append(f"- Missing `on`: **{summary.missing_on}**")
-    lines.append("")
+## Detected Issues
+
+{issues}
+
+## Raw Summary (debug)
+
+```json
+{payload}
+```
+"""
 
+
+def _format_markdown(
+    summary: WorkflowHealthSummary, run_id: str, now: _dt.datetime
+) -> str:
     if summary.issues:
-        lines.append("## Detected Issues")
-        lines.append("")
-        for issue in summary.issues:
-            lines.append(
-                f"- `{issue.file}` — **{issue.kind}** — {issue.detail}"
-            )
-        lines.append("")
+        issues = "\n".join(
+            f"- `{issue.file}` — **{issue.kind}** — {issue.detail}"
+            for issue in summary.issues
+        )
     else:
-        lines.append("## Detected Issues")
-        lines.append("")
-        lines.append("No workflow issues detected. ✅")
-        lines.append("")
+        issues = "No workflow issues detected. ✅"
 
     # Optional: dump a small machine-readable appendix
-    lines.append("## Raw Summary (debug)")
-    lines.append("")
-    payload = asdict(summary)
-    # remove issues detail to keep it short
+    # (issues detail left out to keep it short)
     payload = {
-        k: v
-        for k, v in payload.items()
-        if k != "issues"
+        "files_scanned": summary.files_scanned,
+        "parse_errors": summary.parse_errors,
+        "missing_name": summary.missing_name,
+        "missing_on": summary.missing_on,
     }
-    lines.append("```json")
-    import json as _json  # local import to avoid unused in stub
-
-    lines.append(_json.dumps(payload, indent=2, sort_keys=True))
-    lines.append("```")
-    lines.append("")
-
-    return "\n".join(lines)
-
-
-def write_report(summary: WorkflowHealthSummary) -> Path:
+    if orjson is not None:
+        payload_json = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    else:
+        payload_json = json.dumps(payload, indent=2, sort_keys=True)
+
+    return _REPORT_TEMPLATE.format(
+        generated_at=now.isoformat() + "Z",
+        run_id=run_id,
+        files_scanned=summary.files_scanned,
+        parse_errors=summary.parse_errors,
+        missing_name=summary.missing_name,
+        missing_on=summary.missing_on,
+        issues=issues,
+        payload=payload_json,
+    )
+
+
+def write_report(
+    summary: WorkflowHealthSummary, now: Optional[_dt.datetime] = None
+) -> Path:
     _ensure_report_dir()
-    today = _dt.datetime.utcnow().strftime("%Y-%m-%d")
-    run_id = _dt.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    # One clock read: file date, run id and "Generated at" all agree.
+    if now is None:
+        now = _dt.datetime.utcnow()
+    today = now.strftime("%Y-%m-%d")
+    run_id = now.strftime("%Y%m%d-%H%M%S")
 
     report_path = REPORT_DIR / f"workflow_health_{today}.md"
     latest_path = REPORT_DIR / "workflow_health_latest.md"
 
-    md = _format_markdown(summary, run_id=run_id)
-    report_path.write_text(md, encoding="utf-8")
-    latest_path.write_text(md, encoding="utf-8")
+    # Encode once; the dated report and the "latest" copy share the bytes.
+    md = _format_markdown(summary, run_id=run_id, now=now).encode("utf-8")
+    write_atomic(report_path, md)
+    write_atomic(latest_path, md)
 
     return report_path
 
@@ -176,8 +281,9 @@ def main() -> None:
     print("=== StegVerse Workflow Health Guardian ===")
     print(f"Scanning workflows under: {WORKFLOW_DIR}")
 
+    now = _dt.datetime.utcnow()
     summary = scan_workflows()
-    report_path = write_report(summary)
+    report_path = write_report(summary, now)
 
     print("Workflow health summary:")
     print(f"  files_scanned  : {summary.files_scanned}")
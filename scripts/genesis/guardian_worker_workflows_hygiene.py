@@ -30,6 +30,11 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # optional: faster JSON parse/serialize, stdlib json otherwise
+except Exception:
+    orjson = None
+
 try:
     import yaml  # Used only to confirm file is valid YAML; we modify as text.
 except Exception:
@@ -75,8 +80,8 @@ def load_latest_run() -> Dict[str, Any]:
         print("[Guardians] No latest guardian run file; proceeding with generic hygiene.")
         return {}
     try:
-        with LATEST_JSON.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        raw = LATEST_JSON.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         print(f"[Guardians] Could not parse latest guardian JSON: {e}")
         return {}
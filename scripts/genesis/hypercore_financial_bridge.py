@@ -30,8 +30,8 @@ HYPERCORE_DOC = ROOT / "docs" / "STEGVERSE_HYPERCORE.md"
 def find_latest_financial_json() -> Optional[Path]:
     if not LEDGER_DIR.exists():
         return None
-    candidates = sorted(LEDGER_DIR.glob("daily_*.json"))
-    return candidates[-1] if candidates else None
+    # Names embed the date; an O(N) max instead of sorting every candidate.
+    return max(LEDGER_DIR.glob("daily_*.json"), key=lambda p: p.name, default=None)
 
 
 def load_summary(p: Path) -> Optional[dict]:
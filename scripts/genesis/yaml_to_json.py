@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+StegVerse Genesis - YAML -> JSON config mirror v0.1
+
+The YAML configs stay the human-edited source. This writes a JSON sibling
+next to each one (same name, .json suffix) that the guardian scripts read
+instead, skipping the YAML parse:
+
+  {"source_sha256": "<sha256 of the YAML bytes>", "data": <parsed YAML>}
+
+Readers only trust a sibling whose source_sha256 matches the current YAML,
+so editing the YAML without rerunning this just falls back to parsing it.
+
+Usage:
+  python scripts/genesis/yaml_to_json.py [config.yaml ...]
+  (no arguments: the default guardian configs below)
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import yaml
+
+from genesis_common import _SafeLoader
+
+ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_CONFIGS = [
+    ROOT / "docs" / "governance" / "repo_alignment_expectations.yaml",
+    ROOT / "scripts" / "genesis" / "guardian_registry.yaml",
+]
+
+
+def mirror(src: Path) -> Path:
+    raw = src.read_bytes()
+    payload = {
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        "data": yaml.load(raw, Loader=_SafeLoader) or {},
+    }
+    dest = src.with_suffix(".json")
+    dest.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return dest
+
+
+def main(argv: List[str]) -> int:
+    sources = [Path(a) for a in argv] or DEFAULT_CONFIGS
+    for src in sources:
+        if not src.exists():
+            print(f"[yaml_to_json] Missing: {src}")
+            return 1
+        dest = mirror(src)
+        print(f"[yaml_to_json] {src} -> {dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,87 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "genesis"))
+
+import guardian_issues as gi  # noqa: E402
+
+
+@pytest.fixture
+def index_paths(tmp_path, monkeypatch):
+    snapshot = tmp_path / "guardian_issues_index.json"
+    log = tmp_path / "guardian_issues_index.jsonl"
+    monkeypatch.setattr(gi, "ISSUE_INDEX_JSON", snapshot)
+    monkeypatch.setattr(gi, "ISSUE_INDEX_LOG", log)
+    monkeypatch.setattr(gi, "_persisted", {})
+    return snapshot, log
+
+
+def _log_lines(log: Path):
+    return log.read_bytes().splitlines() if log.exists() else []
+
+
+def test_round_trip_appends_only_changed_entries(index_paths):
+    snapshot, log = index_paths
+    idx = gi.load_issue_index()
+    idx["issues"]["a"] = {"number": 1, "state": "open"}
+    idx["issues"]["b"] = {"number": 2, "state": "open"}
+    gi.save_issue_index(idx)
+    assert not snapshot.exists()
+    assert len(_log_lines(log)) == 2
+
+    idx = gi.load_issue_index()
+    assert idx["issues"] == {"a": {"number": 1, "state": "open"}, "b": {"number": 2, "state": "open"}}
+
+    # Saving unchanged entries writes nothing; a changed one appends one line.
+    gi.save_issue_index(idx)
+    assert len(_log_lines(log)) == 2
+    idx["issues"]["b"]["state"] = "closed"
+    gi.save_issue_index(idx)
+    assert len(_log_lines(log)) == 3
+    assert gi.load_issue_index()["issues"]["b"] == {"number": 2, "state": "closed"}
+
+
+def test_compaction_folds_log_into_snapshot(index_paths):
+    snapshot, log = index_paths
+    idx = gi.load_issue_index()
+    idx["issues"]["a"] = {"number": 1, "rev": 0}
+    gi.save_issue_index(idx)
+    for rev in range(1, gi.COMPACT_FACTOR + 1):
+        idx["issues"]["a"]["rev"] = rev
+        gi.save_issue_index(idx)
+
+    assert not log.exists()
+    on_disk = json.loads(snapshot.read_text(encoding="utf-8"))
+    assert on_disk["issues"] == {"a": {"number": 1, "rev": gi.COMPACT_FACTOR}}
+    assert gi.load_issue_index()["issues"] == on_disk["issues"]
+
+    # Later changes go back to the log and replay over the snapshot.
+    idx = gi.load_issue_index()
+    idx["issues"]["b"] = {"number": 2}
+    gi.save_issue_index(idx)
+    assert len(_log_lines(log)) == 1
+    assert gi.load_issue_index()["issues"] == {
+        "a": {"number": 1, "rev": gi.COMPACT_FACTOR},
+        "b": {"number": 2},
+    }
+
+
+def test_torn_last_line_is_skipped_and_repaired(index_paths):
+    _, log = index_paths
+    idx = gi.load_issue_index()
+    idx["issues"]["a"] = {"number": 1}
+    gi.save_issue_index(idx)
+    with log.open("ab") as f:
+        f.write(b'{"key":"b","numb')
+
+    idx = gi.load_issue_index()
+    assert idx["issues"] == {"a": {"number": 1}}
+
+    idx["issues"]["c"] = {"number": 3}
+    gi.save_issue_index(idx)
+    assert gi.load_issue_index()["issues"] == {"a": {"number": 1}, "c": {"number": 3}}
@@ -0,0 +1,66 @@
+from typing import Dict, List
+
+from scripts.entities.task_graph import TaskGraph, TaskNode, default_task_graph
+
+
+def _graph(edges: Dict[str, List[str]]) -> TaskGraph:
+    return TaskGraph({tid: TaskNode(tid, after=list(deps)) for tid, deps in edges.items()})
+
+
+def _recursive_order(graph: TaskGraph, selected: List[str]) -> List[str]:
+    # The original recursive DFS, kept as the reference ordering.
+    result: List[str] = []
+    visited: Dict[str, bool] = {}
+
+    def visit(tid: str) -> None:
+        if tid in visited:
+            return
+        visited[tid] = True
+        node = graph.nodes.get(tid)
+        if node:
+            for dep in node.after:
+                visit(dep)
+        result.append(tid)
+
+    for tid in selected:
+        visit(tid)
+    return list(dict.fromkeys(result))
+
+
+def test_default_graph_runs_dependencies_first():
+    order = default_task_graph().linear_order(["status_digest", "repo_hygiene"])
+    assert order == ["economic_snapshot", "status_digest", "repo_hygiene"]
+
+
+def test_unknown_and_repeated_tasks_appear_once():
+    graph = _graph({"b": ["a"]})
+    assert graph.linear_order(["b", "x", "b", "a", "x"]) == ["a", "b", "x"]
+
+
+def test_matches_recursive_order():
+    graph = _graph({
+        "a": ["b", "c"],
+        "b": ["d"],
+        "c": ["d", "e"],
+        "d": [],
+        "e": ["missing"],
+        "f": ["a", "e"],
+    })
+    for selected in (["f"], ["a", "f"], ["e", "c", "a"], ["d", "b", "f", "c"]):
+        assert graph.linear_order(selected) == _recursive_order(graph, selected)
+
+
+def test_cycle_terminates_with_each_task_once():
+    graph = _graph({"a": ["b"], "b": ["c"], "c": ["a"], "d": ["d"]})
+    for selected in (["a"], ["c", "d"], ["d", "b", "a"]):
+        order = graph.linear_order(selected)
+        assert order == _recursive_order(graph, selected)
+        assert len(order) == len(set(order))
+    assert graph.linear_order(["a"]) == ["c", "b", "a"]
+
+
+def test_deep_chain_does_not_hit_recursion_limit():
+    n = 5000
+    graph = _graph({f"t{i}": [f"t{i + 1}"] for i in range(n)})
+    order = graph.linear_order(["t0"])
+    assert order == [f"t{i}" for i in range(n, -1, -1)]